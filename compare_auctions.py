@@ -41,7 +41,7 @@ def run_comparison(steps=200, spawn_rate=0.25, seed=42):
             model.step()
         
         stats = model.get_stats()
-        auction_stats = mechanism.stats
+        auction_stats = mechanism.get_stats()
         
         results[auction_type.value] = {
             'total_crossed': stats['total_crossed'],
@@ -7,6 +7,7 @@ Writes to file instead of UI for cleaner debugging.
 from datetime import datetime
 from typing import List, Dict
 from collections import deque
+from operator import itemgetter
 
 
 class DebugLogger:
@@ -35,10 +36,15 @@ class DebugLogger:
             'negotiation': 0,
         }
         
-        self._init_log_file()
+        # The file is (re)started on clear() or on the first write, not at
+        # import: importing this module must not truncate debug.log
+        self._file_started = False
     
     def _init_log_file(self):
-        """Initialize log file"""
+        """Initialize log file (left untouched while disabled)"""
+        if not self.enabled:
+            return
+        self._file_started = True
         try:
             with open(self.log_file, 'w') as f:
                 f.write("=" * 70 + "\n")
@@ -50,6 +56,10 @@ class DebugLogger:
     
     def _write_to_file(self, message: str):
         """Write message to log file"""
+        if not self.enabled:
+            return
+        if not self._file_started:
+            self._init_log_file()
         try:
             with open(self.log_file, 'a') as f:
                 f.write(message + "\n")
@@ -105,6 +115,8 @@ class DebugLogger:
         self._write_to_file(file_message)
     
     def log_spawn(self, vehicle_id: int, direction: str, urgency: int):
+        if not self.enabled:
+            return
         self.log('spawn', f"V{vehicle_id} spawned ({direction}, urg={urgency})", {
             'vehicle_id': vehicle_id,
             'direction': direction,
@@ -113,6 +125,8 @@ class DebugLogger:
     
     def log_enter_corridor(self, vehicle_id: int, direction: str, 
                            axis: str, mechanism: str):
+        if not self.enabled:
+            return
         self.log('enter_corridor', 
                 f"V{vehicle_id} → {axis} corridor ({mechanism})", {
             'vehicle_id': vehicle_id,
@@ -122,6 +136,8 @@ class DebugLogger:
         })
     
     def log_enter_conflict_zone(self, vehicle_id: int, direction: str, urgency: int):
+        if not self.enabled:
+            return
         self.log('enter_conflict', 
                 f"V{vehicle_id} → CONFLICT ZONE (urg={urgency})", {
             'vehicle_id': vehicle_id,
@@ -130,6 +146,8 @@ class DebugLogger:
         })
     
     def log_exit_conflict_zone(self, vehicle_id: int, direction: str):
+        if not self.enabled:
+            return
         self.log('exit_conflict', f"V{vehicle_id} ← conflict zone", {
             'vehicle_id': vehicle_id,
             'direction': direction,
@@ -137,6 +155,8 @@ class DebugLogger:
     
     def log_wait_conflict_zone(self, vehicle_id: int, direction: str, 
                                urgency: int, blocking_id: int):
+        if not self.enabled:
+            return
         self.log('wait_conflict', 
                 f"V{vehicle_id} (urg={urgency}) WAITING (blocked by V{blocking_id})", {
             'vehicle_id': vehicle_id,
@@ -147,6 +167,8 @@ class DebugLogger:
     
     def log_exit_grid(self, vehicle_id: int, direction: str, 
                       total_time: int, wait_time: int):
+        if not self.enabled:
+            return
         self.log('exit_grid', 
                 f"V{vehicle_id} EXITED (total={total_time}, wait={wait_time})", {
             'vehicle_id': vehicle_id,
@@ -158,9 +180,11 @@ class DebugLogger:
     def log_auction(self, axis: str, winner_id: int, winner_urgency: int, 
                     winning_bid: int, price_paid: int, num_bidders: int, 
                     all_bids, auction_type: str = 'vickrey', total_rounds: int = 1):
+        if not self.enabled:
+            return
         # all_bids est maintenant un dict {vehicle_id: bid}
         if isinstance(all_bids, dict):
-            bids_str = ", ".join([f"V{vid}(b={bid})" for vid, bid in sorted(all_bids.items(), key=lambda x: x[1], reverse=True)])
+            bids_str = ", ".join([f"V{vid}(b={bid})" for vid, bid in sorted(all_bids.items(), key=itemgetter(1), reverse=True)])
         else:
             bids_str = str(all_bids)
         
@@ -178,6 +202,8 @@ class DebugLogger:
     def log_negotiation(self, winner_id: int, loser_id: int, method: str, 
                         details: Dict = None):
         """Log une négociation avec détails des rounds"""
+        if not self.enabled:
+            return
         details = details or {}
         
         # Message de base
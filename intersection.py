@@ -3,8 +3,10 @@ Intersection Model with Multi-Agent Support
 ============================================
 """
 import random
-from typing import Optional, List, Dict
-from collections import deque
+from typing import Optional, List, Dict, Any
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 
 from constants import (
     GRID_SIZE, INTERSECTION_POS, PARKING_ZONES, BARRIER_POSITIONS,
@@ -13,10 +15,31 @@ from constants import (
 )
 from vehicle import Vehicle
 # AJOUT DE AuctionType DANS L'IMPORT
-from mechanisms import create_mechanism, NegotiationType, AuctionType
+from mechanisms import create_mechanism, NegotiationType, AuctionType, BaseMechanism
 from debug import logger
 
 
+# All waiting positions, for O(1) membership tests
+_WAITING_POS_SET = frozenset(WAITING_POSITIONS.values())
+
+# Barrier directions feeding each corridor axis (NS processed first)
+_AXIS_DIRECTIONS = {
+    CorridorAxis.NS: ('N', 'S'),
+    CorridorAxis.EW: ('E', 'W'),
+}
+
+# Parking slots (3×3 per direction), precomputed per slot index
+_PARKING_CAPACITY = 9
+_PARKING_SLOTS = {
+    d: [
+        (zone['start'][0] + i % 3, zone['start'][1] + i // 3) if d in ('N', 'S')
+        else (zone['start'][0] + i // 3, zone['start'][1] + i % 3)
+        for i in range(_PARKING_CAPACITY)
+    ]
+    for d, zone in PARKING_ZONES.items()
+}
+
+
 class SimpleIntersection:
     """
     Intersection simulation with pluggable selection mechanisms.
@@ -37,6 +60,19 @@ class SimpleIntersection:
         self.step_count = 0
         self.vehicle_counter = 0
         
+        # Cached enum value (avoid descriptor lookups on hot paths)
+        self._mechanism_name = mechanism.value
+        self._has_urgency = mechanism != Mechanism.FCFS
+        
+        # Parking priority, chosen once per mechanism:
+        # FCFS sorts by arrival, Auction/Negotiation by bid (highest first)
+        if self._has_urgency:
+            self._sort_key = attrgetter('bid')
+            self._sort_reverse = True
+        else:
+            self._sort_key = attrgetter('arrival_time')
+            self._sort_reverse = False
+        
         # Create mechanism using factory WITH AUCTION TYPE
         self.mechanism = create_mechanism(mechanism, 
                                         negotiation_type=negotiation_type,
@@ -46,17 +82,24 @@ class SimpleIntersection:
         self.parking_zones: Dict[str, List[Vehicle]] = {
             'N': [], 'S': [], 'E': [], 'W': []
         }
-        self.barrier_queues: Dict[str, deque] = {
-            'N': deque(), 'S': deque(), 'E': deque(), 'W': deque()
+        # Barrier queues: vehicle_id -> Vehicle, in arrival (insertion) order
+        self.barrier_queues: Dict[str, Dict[int, Vehicle]] = {
+            'N': {}, 'S': {}, 'E': {}, 'W': {}
         }
         self.corridor_reserved = {
             CorridorAxis.NS: None,
             CorridorAxis.EW: None,
         }
-        self.corridor_vehicles: Dict[int, Vehicle] = {}
-        self.conflict_zone_vehicle = None
+        # Small (<= ~8 vehicles): a plain list, in corridor entry order
+        self.corridor_vehicles: List[Vehicle] = []
+        self.conflict_zone_vehicle: Optional[int] = None  # vehicle id
         self.exited_vehicles: List[Vehicle] = []
         
+        # Running occupancy counters (kept in sync by the step methods)
+        self._parking_total = 0
+        self._barrier_total = 0
+        self._waiting_count = 0
+        
         # Statistics
         self.stats = {
             'total_spawned': 0,
@@ -70,6 +113,17 @@ class SimpleIntersection:
         # Log the specific name of the mechanism (e.g. "Auction (English)")
         logger.log('state', f"Simulation started: {self.mechanism.name}", {})
     
+    @property
+    def mechanism(self) -> BaseMechanism:
+        return self._mechanism
+    
+    @mechanism.setter
+    def mechanism(self, mechanism: BaseMechanism):
+        """Set the mechanism and bind its hot-path methods once"""
+        self._mechanism = mechanism
+        self._mech_select = mechanism.select
+        self._mech_conflict = mechanism.select_at_conflict
+    
     # ... LE RESTE DE LA CLASSE RESTE INCHANGÉ ...
     # (Copiez ici le reste des méthodes spawn_vehicle, move_parking_to_barrier, etc.
     #  depuis votre version précédente corrigée)
@@ -81,7 +135,7 @@ class SimpleIntersection:
         """Spawn a new vehicle in the parking zone"""
         self.vehicle_counter += 1
         
-        is_urgent = (self.mechanism_type != Mechanism.FCFS and 
+        is_urgent = (self._has_urgency and 
                      random.random() < self.urgent_probability)
         
         vehicle = Vehicle(
@@ -92,18 +146,11 @@ class SimpleIntersection:
             mechanism=self.mechanism_type
         )
         
-        # Calculate parking position
-        parking = PARKING_ZONES[direction]
-        idx = len(self.parking_zones[direction])
-        if direction in ['N', 'S']:
-            px = parking['start'][0] + (idx % 3)
-            py = parking['start'][1] + (idx // 3)
-        else:
-            px = parking['start'][0] + (idx // 3)
-            py = parking['start'][1] + (idx % 3)
-        
-        vehicle.set_parking_position((px, py))
+        # Parking position: next free slot index
+        slot = len(self.parking_zones[direction])
+        vehicle.set_parking_position(_PARKING_SLOTS[direction][slot])
         self.parking_zones[direction].append(vehicle)
+        self._parking_total += 1
         self.stats['total_spawned'] += 1
         
         logger.log_spawn(vehicle.id, direction, vehicle.urgency)
@@ -111,9 +158,14 @@ class SimpleIntersection:
     
     def try_spawn_vehicles(self):
         """Attempt to spawn vehicles based on spawn rate"""
-        for direction in ['N', 'S', 'E', 'W']:
-            if random.random() < self.spawn_rate:
-                if len(self.parking_zones[direction]) < 9:
+        # Draws stay interleaved with spawn_vehicle's own draws so that a
+        # given seed keeps producing the same traffic
+        rand = random.random
+        spawn_rate = self.spawn_rate
+        parking_zones = self.parking_zones
+        for direction in ('N', 'S', 'E', 'W'):
+            if rand() < spawn_rate:
+                if len(parking_zones[direction]) < _PARKING_CAPACITY:
                     self.spawn_vehicle(direction)
     
     # =========================================================================
@@ -128,20 +180,19 @@ class SimpleIntersection:
             if not parking or len(barrier_queue) >= 3:
                 continue
             
-            # Sort based on mechanism
-            if self.mechanism_type == Mechanism.FCFS:
-                parking.sort(key=lambda v: v.arrival_time)
-            else:
-                # Auction/Negotiation: sort by bid
-                parking.sort(key=lambda v: v.calculate_bid(), reverse=True)
+            # Sort based on mechanism (key bound in __init__)
+            parking.sort(key=self._sort_key, reverse=self._sort_reverse)
             
             vehicle = parking.pop(0)
             vehicle.move_to_barrier(self.step_count)
-            barrier_queue.append(vehicle)
+            barrier_queue[vehicle.id] = vehicle
+            self._parking_total -= 1
+            self._barrier_total += 1
             
-            logger.log('enter_corridor', 
-                      f"V{vehicle.id} → BARRIER ({direction})", 
-                      {'vehicle_id': vehicle.id, 'direction': direction})
+            if logger.enabled:
+                logger.log('enter_corridor', 
+                          f"V{vehicle.id} → BARRIER ({direction})", 
+                          {'vehicle_id': vehicle.id, 'direction': direction})
     
     # =========================================================================
     # BARRIER TO CORRIDOR
@@ -151,151 +202,157 @@ class SimpleIntersection:
         if self.corridor_reserved[axis] is not None:
             return
         
-        directions = ['N', 'S'] if axis == CorridorAxis.NS else ['E', 'W']
-        
         # Collect all candidates
-        candidates = []
-        for d in directions:
-            candidates.extend(list(self.barrier_queues[d]))
+        queues = self.barrier_queues
+        candidates = list(chain.from_iterable(
+            queues[d].values() for d in _AXIS_DIRECTIONS[axis]
+        ))
         
         if not candidates:
             return
         
         # Use mechanism to select winner
         context = {'current_step': self.step_count, 'axis': axis}
-        result = self.mechanism.select(candidates, axis, context)
+        result = self._mech_select(candidates, axis, context)
         
         if result and result.winner:
             winner = result.winner
             
             # Remove from barrier queue
-            self.barrier_queues[winner.direction].remove(winner)
+            del self.barrier_queues[winner.direction][winner.id]
+            self._barrier_total -= 1
             
             # Reserve corridor and enter
             self.corridor_reserved[axis] = winner.id
             winner.enter_corridor(self.step_count)
-            self.corridor_vehicles[winner.id] = winner
+            self.corridor_vehicles.append(winner)
             
             # Record wait time
             wait_time = self.step_count - winner.arrival_time
             self.stats['total_wait_time'] += wait_time
             
-            # Log based on mechanism type
-            logger.log_enter_corridor(
-                winner.id, winner.direction, 
-                axis.value, self.mechanism.name
-            )
-            
-            # Log mechanism-specific details
-            if hasattr(self.mechanism, 'get_last_auction'):
-                method = result.details.get('method', '')
-                if 'auction' in method:
-                    details = result.details
-                    logger.log_auction(
-                        axis.value, winner.id, winner.urgency,
-                        details.get('winning_bid', 0),
-                        details.get('price_paid', 0),
-                        len(details.get('all_bids', {})),
-                        details.get('all_bids', {}),
-                        auction_type=method.replace('_auction', ''),
-                        total_rounds=details.get('total_rounds', 1)
-                    )
-            elif result.details.get('method') == 'negotiation':
-                neg_details = result.details.get('negotiation_details', {})
-                logger.log_negotiation(
-                    result.details.get('winner_id'),
-                    result.details.get('loser_id'),
-                    result.details.get('negotiation_type', 'unknown'),
-                    neg_details
-                )
+            if logger.enabled:
+                self._log_barrier_selection(result, axis)
     
+    def _log_barrier_selection(self, result, axis: CorridorAxis):
+        """Helper for logging corridor entry and mechanism details"""
+        winner = result.winner
+        
+        # Log based on mechanism type
+        logger.log_enter_corridor(
+            winner.id, winner.direction, 
+            axis.value, self.mechanism.name
+        )
+        
+        # Log mechanism-specific details
+        if hasattr(self.mechanism, 'get_last_auction'):
+            method = result.details.get('method', '')
+            if 'auction' in method:
+                details = result.details
+                logger.log_auction(
+                    axis.value, winner.id, winner.urgency,
+                    details.get('winning_bid', 0),
+                    details.get('price_paid', 0),
+                    len(details.get('all_bids', {})),
+                    details.get('all_bids', {}),
+                    auction_type=method.replace('_auction', ''),
+                    total_rounds=details.get('total_rounds', 1)
+                )
+        elif result.details.get('method') == 'negotiation':
+            neg_details = result.details.get('negotiation_details', {})
+            logger.log_negotiation(
+                result.details.get('winner_id'),
+                result.details.get('loser_id'),
+                result.details.get('negotiation_type', 'unknown'),
+                neg_details
+            )
+
     # =========================================================================
     # CORRIDOR MOVEMENT & CONFLICT ZONE (CORRECTED)
     # =========================================================================
     def move_corridor_vehicles(self):
-        """Move vehicles in corridor and handle conflict zone"""
-        exited_ids = []
+        """
+        Move vehicles in corridor and handle conflict zone.
         
-        # Step 1: Identify vehicles waiting at THEIR SPECIFIC intersection line
+        Single sweep over the corridor: vehicles that are not queued at
+        their waiting position move immediately, while queued vehicles are
+        collected and resolved once the sweep is done. Nothing moved during
+        the sweep affects the resolution, whose inputs (who waits, whether
+        the zone was free) are fixed at the start of the step.
+        """
+        exited = []
         waiting = []
-        for v in self.corridor_vehicles.values():
-            # Check strictly against the waiting position for THIS vehicle's direction
-            if (v.pos == WAITING_POSITIONS[v.direction] and 
-                v.state != VehicleState.IN_CONFLICT):
-                waiting.append(v)
+        zone_was_free = self.conflict_zone_vehicle is None
+        # Vehicles standing on any waiting position once this step is done
+        waiting_count = 0
         
-        # Step 2: Handle conflict resolution if the zone is free
+        # Step 1: Move everyone not queued at the intersection line
+        for vehicle in self.corridor_vehicles:
+            current_pos = vehicle.pos
+            
+            # --- Vehicles queued at THEIR SPECIFIC waiting position ---
+            # (a vehicle already crossing, i.e. won previously, just moves)
+            if (current_pos == vehicle.waiting_pos and 
+                vehicle.state != VehicleState.IN_CONFLICT):
+                waiting.append(vehicle)
+                continue
+            
+            self._move_vehicle_safely(vehicle, exited)
+            
+            # --- Logic for vehicles exiting Conflict Zone ---
+            if current_pos == INTERSECTION_POS:
+                # Free the zone AFTER the move
+                self.conflict_zone_vehicle = None
+                vehicle.state = VehicleState.IN_CORRIDOR
+                logger.log_exit_conflict_zone(vehicle.id, vehicle.direction)
+            
+            if vehicle.pos in _WAITING_POS_SET:
+                waiting_count += 1
+        
+        # Step 2: Handle conflict resolution if the zone was free
         conflict_winner = None
         
-        if self.conflict_zone_vehicle is None:
+        if zone_was_free:
             if len(waiting) >= 2:
                 # Multiple vehicles - use mechanism to resolve
                 context = {'current_step': self.step_count, 'location': 'conflict'}
-                result = self.mechanism.select_at_conflict(waiting, context)
+                result = self._mech_conflict(waiting, context)
                 if result:
                     conflict_winner = result.winner
-                    self._log_conflict_resolution(result, waiting)
+                    if logger.enabled:
+                        self._log_conflict_resolution(result, waiting)
             elif len(waiting) == 1:
                 # Single vehicle - automatic winner
                 conflict_winner = waiting[0]
         
-        # Step 3: Move vehicles
-        for vehicle in list(self.corridor_vehicles.values()):
-            current_pos = vehicle.pos
-            
-            # --- Logic for vehicles at Waiting Position ---
-            if current_pos == WAITING_POSITIONS[vehicle.direction]:
-                # If this vehicle is already crossing (won previously), just move
-                if vehicle.state == VehicleState.IN_CONFLICT:
-                    self._move_vehicle_safely(vehicle, exited_ids)
-                    continue
-                
-                # If someone else is in the zone -> Wait
-                if self.conflict_zone_vehicle is not None:
-                    self.stats['collisions_avoided'] += 1
-                    continue
-                
-                # If this vehicle is the winner of this turn -> Enter
-                if conflict_winner and vehicle.id == conflict_winner.id:
-                    self.conflict_zone_vehicle = vehicle.id
-                    vehicle.state = VehicleState.IN_CONFLICT
-                    self._move_vehicle_safely(vehicle, exited_ids)
-                    logger.log_enter_conflict_zone(
-                        vehicle.id, vehicle.direction, vehicle.urgency
-                    )
-                    continue
-                
-                # Otherwise -> Lost conflict, Wait
+        # Step 3: Winner enters the zone, everyone else waits
+        for vehicle in waiting:
+            if vehicle is conflict_winner:
+                self.conflict_zone_vehicle = vehicle.id
+                vehicle.state = VehicleState.IN_CONFLICT
+                self._move_vehicle_safely(vehicle, exited)
+                logger.log_enter_conflict_zone(
+                    vehicle.id, vehicle.direction, vehicle.urgency
+                )
+            else:
+                # Zone occupied or lost conflict -> Wait
                 self.stats['collisions_avoided'] += 1
-                continue
-            
-            # --- Logic for vehicles exiting Conflict Zone ---
-            if current_pos == INTERSECTION_POS:
-                # Vehicle moves out of intersection
-                self._move_vehicle_safely(vehicle, exited_ids)
-                
-                # Free the zone AFTER the move
-                self.conflict_zone_vehicle = None
-                vehicle.state = VehicleState.IN_CORRIDOR
-                logger.log_exit_conflict_zone(vehicle.id, vehicle.direction)
-                continue
-            
-            # --- Normal Movement ---
-            self._move_vehicle_safely(vehicle, exited_ids)
+                waiting_count += 1
+        
+        self._waiting_count = waiting_count
         
         # Clean up exited vehicles
-        for vid in exited_ids:
-            del self.corridor_vehicles[vid]
+        if exited:
+            self.corridor_vehicles = [
+                v for v in self.corridor_vehicles if v.exit_time is None
+            ]
 
-    def _move_vehicle_safely(self, vehicle: Vehicle, exited_ids: List[int]):
+    def _move_vehicle_safely(self, vehicle: Vehicle, exited: List[Vehicle]):
         """Helper to move vehicle and check exit conditions"""
         vehicle.move()
         
         if vehicle.has_exited():
             vehicle.exit_time = self.step_count
-            total_time = vehicle.exit_time - vehicle.arrival_time
-            wait_time = (vehicle.entry_time - vehicle.arrival_time 
-                        if vehicle.entry_time else 0)
             
             self.corridor_reserved[vehicle.axis] = None
             
@@ -304,14 +361,18 @@ class SimpleIntersection:
                 self.conflict_zone_vehicle = None
             
             self.exited_vehicles.append(vehicle)
-            exited_ids.append(vehicle.id)
+            exited.append(vehicle)
             self.stats['total_crossed'] += 1
             if vehicle.is_urgent():
                 self.stats['urgent_crossed'] += 1
             
-            logger.log_exit_grid(
-                vehicle.id, vehicle.direction, total_time, wait_time
-            )
+            if logger.enabled:
+                total_time = vehicle.exit_time - vehicle.arrival_time
+                wait_time = (vehicle.entry_time - vehicle.arrival_time 
+                            if vehicle.entry_time else 0)
+                logger.log_exit_grid(
+                    vehicle.id, vehicle.direction, total_time, wait_time
+                )
 
     def _log_conflict_resolution(self, result, waiting):
         """Helper for logging detailed conflict info"""
@@ -355,11 +416,57 @@ class SimpleIntersection:
         self.try_spawn_vehicles()
         self.move_parking_to_barrier()
         
-        for axis in [CorridorAxis.NS, CorridorAxis.EW]:
+        for axis in _AXIS_DIRECTIONS:
             self.process_barrier(axis)
         
         self.move_corridor_vehicles()
     
+    def run(self, n_steps: int) -> Dict:
+        """Execute n_steps simulation steps and return final statistics"""
+        for _ in range(n_steps):
+            self.step()
+        return self.get_stats()
+    
+    # =========================================================================
+    # PARAMETER SWEEPS
+    # =========================================================================
+    @staticmethod
+    def _run_one(config: Dict[str, Any]) -> Dict:
+        """Run one independent simulation (executed in a worker process)"""
+        # Sweep runs must not share (and truncate) the parent's debug.log;
+        # restored afterwards in case this runs in-process
+        was_enabled = logger.enabled
+        logger.enabled = False
+        try:
+            config = dict(config)
+            n_steps = config.pop('n_steps')
+            return SimpleIntersection(**config).run(n_steps)
+        finally:
+            logger.enabled = was_enabled
+    
+    @classmethod
+    def sweep(cls, configs: List[Dict[str, Any]],
+              max_workers: int = None) -> List[Dict]:
+        """
+        Run independent simulations in parallel, one per config.
+        
+        Each config holds the constructor arguments plus 'n_steps'.
+        Runs share no state, so they are fanned out over a process pool;
+        each worker process seeds its own RNG from the config's 'seed'.
+        Debug logging is disabled in the workers.
+        
+        Example:
+            >>> SimpleIntersection.sweep([
+            ...     {'mechanism': Mechanism.FCFS, 'seed': 42, 'n_steps': 500},
+            ...     {'mechanism': Mechanism.AUCTION, 'seed': 42, 'n_steps': 500},
+            ... ])
+        
+        Returns:
+            List of final statistics, in the same order as configs
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls._run_one, configs))
+    
     # =========================================================================
     # GETTERS (UNCHANGED)
     # =========================================================================
@@ -370,10 +477,10 @@ class SimpleIntersection:
             for i, v in enumerate(vehicles):
                 result.append(self._vehicle_to_dict(v, 'parking', i))
         for direction, queue in self.barrier_queues.items():
-            for i, v in enumerate(queue):
+            for i, v in enumerate(queue.values()):
                 result.append(self._vehicle_to_dict(v, 'barrier', i))
-        for v in self.corridor_vehicles.values():
-            is_waiting = v.pos in WAITING_POSITIONS.values()
+        for v in self.corridor_vehicles:
+            is_waiting = v.pos in _WAITING_POS_SET
             if v.state == VehicleState.IN_CONFLICT:
                 state = 'conflict'
             elif is_waiting:
@@ -392,8 +499,8 @@ class SimpleIntersection:
             'direction': v.direction,
             'pos': v.pos,
             'state': state,
-            'urgency': v.urgency if self.mechanism_type != Mechanism.FCFS else None,
-            'bid': v.calculate_bid() if self.mechanism_type != Mechanism.FCFS else None,
+            'urgency': v.urgency if self._has_urgency else None,
+            'bid': v.bid if self._has_urgency else None,
             'is_urgent': v.is_urgent(),
             'is_negotiating': v.is_negotiating,
             'fuel': v.fuel_level,
@@ -408,19 +515,17 @@ class SimpleIntersection:
             avg_wait = self.stats['total_wait_time'] / self.stats['total_crossed']
         
         mech_stats = self.mechanism.get_stats()
-        waiting_count = sum(1 for v in self.corridor_vehicles.values() 
-                           if v.pos in WAITING_POSITIONS.values())
         
         result = {
             'step': self.step_count,
-            'mechanism': self.mechanism_type.value,
+            'mechanism': self._mechanism_name,
             'total_spawned': self.stats['total_spawned'],
             'total_crossed': self.stats['total_crossed'],
             'urgent_crossed': self.stats['urgent_crossed'],
-            'parking_count': sum(len(p) for p in self.parking_zones.values()),
-            'barrier_count': sum(len(q) for q in self.barrier_queues.values()),
+            'parking_count': self._parking_total,
+            'barrier_count': self._barrier_total,
             'corridor_count': len(self.corridor_vehicles),
-            'waiting_at_intersection': waiting_count,
+            'waiting_at_intersection': self._waiting_count,
             'avg_wait_time': avg_wait,
             'ns_corridor': 'RESERVED' if self.corridor_reserved[CorridorAxis.NS] else 'FREE',
             'ew_corridor': 'RESERVED' if self.corridor_reserved[CorridorAxis.EW] else 'FREE',
@@ -462,7 +567,10 @@ class SimpleIntersection:
         self.corridor_vehicles.clear()
         self.conflict_zone_vehicle = None
         self.exited_vehicles.clear()
+        self._parking_total = 0
+        self._barrier_total = 0
+        self._waiting_count = 0
         self.stats = {k: 0 for k in self.stats}
         self.mechanism.reset()
         logger.clear()
-        logger.log('state', f"RESET: {self.mechanism_type.value}", {})
\ No newline at end of file
+        logger.log('state', f"RESET: {self._mechanism_name}", {})
\ No newline at end of file
@@ -14,8 +14,9 @@ Deux types d'enchères implémentés:
    - Le gagnant paie le 2ème prix le plus élevé
    - Stratégie dominante = révéler vraie valeur (truthful)
 """
+from collections import deque
 from enum import Enum
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Tuple, Deque, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 from mechanisms.base import BaseMechanism, SelectionResult
@@ -30,7 +31,7 @@ class AuctionType(Enum):
     VICKREY = "vickrey"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuctionRound:
     """Un round d'enchère"""
     round_num: int
@@ -40,16 +41,110 @@ class AuctionRound:
     eliminated: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuctionResult:
     """Résultat complet d'une enchère"""
     auction_type: AuctionType
     winner_id: int
+    winner_index: int  # position du gagnant dans candidates
     winning_bid: int
     price_paid: int
-    rounds: List[AuctionRound]
+    rounds: Optional[List[AuctionRound]]  # None si non enregistrés
     total_rounds: int
-    all_bids: Dict[int, int]
+    bidder_ids: List[int]  # alignés sur bids (ordre des candidats)
+    bids: List[int]
+    
+    @property
+    def all_bids(self) -> Dict[int, int]:
+        """vehicle_id -> bid, construit seulement quand il est lu"""
+        return dict(zip(self.bidder_ids, self.bids))
+
+
+# English: incrément par round et sécurité sur le nombre de rounds
+_ENGLISH_INCREMENT = 10
+_ENGLISH_MAX_ROUNDS = 100
+
+
+def _vickrey_top2(bids: List[int]) -> Tuple[int, int, int]:
+    """
+    Un seul passage sur les bids: (index du gagnant, bid gagnant, 2ème prix).
+    
+    À égalité, le premier candidat l'emporte (même ordre qu'un tri stable).
+    """
+    best_idx, best, second = 0, bids[0], 0
+    for i in range(1, len(bids)):
+        bid = bids[i]
+        if bid > best:
+            best_idx, best, second = i, bid, best
+        elif bid > second:
+            second = bid
+    return best_idx, best, second
+
+
+def _english_kernel(bids: List[int], increment: int,
+                    max_rounds: int) -> Tuple[int, int, int, List[int]]:
+    """
+    Issue de l'enchère anglaise en forme close, sans simuler les rounds.
+    
+    Un bidder reste tant que le prix ne dépasse pas son bid: il sort au
+    round bid // increment + 1, et l'enchère s'arrête au round où sort le
+    2ème plus haut bid (ou au round max_rounds).
+    
+    Retourne (index du gagnant, prix final, nombre de rounds, round
+    d'élimination de chaque bidder — 0 s'il n'a pas été éliminé).
+    """
+    top_idx, _, second = _vickrey_top2(bids)
+    uncapped = second // increment + 1
+    round_num = min(uncapped, max_rounds)
+    price = round_num * increment
+    
+    out_round = []
+    for bid in bids:
+        r = bid // increment + 1
+        out_round.append(r if r <= round_num else 0)
+    
+    if round_num < uncapped:
+        # Arrêt sur la sécurité: premier bidder encore actif
+        winner_idx = next(i for i, bid in enumerate(bids) if bid >= price)
+    else:
+        # Seul le plus haut bid reste (ou personne en cas d'égalité en tête)
+        winner_idx = top_idx
+    return winner_idx, price, round_num, out_round
+
+
+def _english_rounds(candidates: List['Vehicle'], bids: List[int],
+                    out_round: List[int], total_rounds: int,
+                    increment: int) -> List[AuctionRound]:
+    """Reconstitue le log par round à partir des rounds d'élimination"""
+    rounds = []
+    active = list(range(len(candidates)))
+    for r in range(1, total_rounds + 1):
+        price = r * increment
+        
+        # Un seul passage: bids du round, éliminés et restants
+        round_bids = {}
+        eliminated = []
+        survivors = []
+        survivor_ids = []
+        for i in active:
+            vid = candidates[i].id
+            if out_round[i] == r:
+                round_bids[vid] = bids[i]
+                eliminated.append(vid)
+            else:
+                round_bids[vid] = price
+                survivors.append(i)
+                survivor_ids.append(vid)
+        active = survivors
+        
+        rounds.append(AuctionRound(
+            round_num=r,
+            bids=round_bids,
+            active_bidders=survivor_ids,
+            current_price=price,
+            eliminated=eliminated
+        ))
+    return rounds
 
 
 class AuctionMechanism(BaseMechanism):
@@ -58,24 +153,28 @@ class AuctionMechanism(BaseMechanism):
     
     Par défaut: Vickrey (plus efficace pour simulation)
     Peut être changé via set_auction_type()
+    
+    L'historique garde les `history_size` dernières enchères
+    (None = historique complet, pour l'analyse).
     """
     
-    def __init__(self, auction_type: AuctionType = AuctionType.VICKREY):
+    def __init__(self, auction_type: AuctionType = AuctionType.VICKREY,
+                 history_size: Optional[int] = 256):
         super().__init__()
         self.auction_type = auction_type
         self.name = f"Auction ({auction_type.value.title()})"
         
+        # avg_price n'est pas stocké: calculé par la propriété / get_stats()
         self.stats.update({
             'auctions_held': 0,
             'total_revenue': 0,
-            'avg_price': 0,
             'total_rounds': 0,
             'english_auctions': 0,
             'vickrey_auctions': 0,
         })
         
         self.last_auction: Optional[AuctionResult] = None
-        self.auction_history: List[AuctionResult] = []
+        self.auction_history: Deque[AuctionResult] = deque(maxlen=history_size)
     
     def set_auction_type(self, auction_type: AuctionType):
         """Change le type d'enchère"""
@@ -92,23 +191,32 @@ class AuctionMechanism(BaseMechanism):
         
         if len(candidates) == 1:
             winner = candidates[0]
+            # Pas d'enchère: bid calculé seulement si les détails sont lus
             return SelectionResult(
                 winner=winner,
-                details={
+                details_factory=lambda: {
                     'method': 'single_candidate',
-                    'winning_bid': winner.calculate_bid(),
+                    'winning_bid': winner.bid,
                     'price_paid': 0
                 }
             )
         
+        # Calculer les bids une seule fois (alignés sur candidates)
+        bids = [v.bid for v in candidates]
+        
+        # Log par round seulement sur demande (context['record_rounds'])
+        record_rounds = bool(context and context.get('record_rounds'))
+        
         # Exécuter l'enchère selon le type
-        if self.auction_type == AuctionType.ENGLISH:
-            result = self._run_english_auction(candidates)
+        if len(candidates) == 2 and not record_rounds:
+            result = self._run_two_bidder_auction(candidates, bids)
+        elif self.auction_type == AuctionType.ENGLISH:
+            result = self._run_english_auction(candidates, bids, record_rounds)
         else:
-            result = self._run_vickrey_auction(candidates)
+            result = self._run_vickrey_auction(candidates, bids, record_rounds)
         
-        # Trouver le véhicule gagnant
-        winner = next(v for v in candidates if v.id == result.winner_id)
+        # Véhicule gagnant (index donné par l'enchère)
+        winner = candidates[result.winner_index]
         
         # Mettre à jour les stats
         self._update_stats(result)
@@ -117,27 +225,14 @@ class AuctionMechanism(BaseMechanism):
         self.last_auction = result
         self.auction_history.append(result)
         
+        # Détails construits seulement s'ils sont lus (logs, UI)
         return SelectionResult(
             winner=winner,
-            details={
-                'method': f'{result.auction_type.value}_auction',
-                'winning_bid': result.winning_bid,
-                'price_paid': result.price_paid,
-                'total_rounds': result.total_rounds,
-                'all_bids': result.all_bids,
-                'rounds': [
-                    {
-                        'round': r.round_num,
-                        'current_price': r.current_price,
-                        'active': r.active_bidders,
-                        'eliminated': r.eliminated
-                    }
-                    for r in result.rounds
-                ]
-            }
+            details_factory=lambda: self._result_to_dict(result)
         )
     
-    def _run_english_auction(self, candidates: List['Vehicle']) -> AuctionResult:
+    def _run_english_auction(self, candidates: List['Vehicle'], bids: List[int],
+                             record_rounds: bool = False) -> AuctionResult:
         """
         Enchère Anglaise (English Auction)
         
@@ -148,48 +243,20 @@ class AuctionMechanism(BaseMechanism):
         4. Continue jusqu'à 1 seul restant
         5. Gagnant paie le prix final
         """
-        # Collecter les bids initiaux (valeurs privées)
-        all_bids = {v.id: v.calculate_bid() for v in candidates}
-        active_bidders = list(all_bids.keys())
-        
-        rounds = []
-        current_price = 0
-        increment = 10
-        round_num = 0
+        # Bids initiaux (valeurs privées)
+        increment = _ENGLISH_INCREMENT
         
-        while len(active_bidders) > 1:
-            round_num += 1
-            current_price += increment
-            
-            # Déterminer qui reste
-            eliminated = []
-            new_active = []
-            
-            for vid in active_bidders:
-                if all_bids[vid] >= current_price:
-                    new_active.append(vid)
-                else:
-                    eliminated.append(vid)
-            
-            # Enregistrer le round
-            round_bids = {vid: min(all_bids[vid], current_price) for vid in active_bidders}
-            rounds.append(AuctionRound(
-                round_num=round_num,
-                bids=round_bids,
-                active_bidders=new_active.copy(),
-                current_price=current_price,
-                eliminated=eliminated
-            ))
-            
-            active_bidders = new_active
-            
-            # Sécurité: max 100 rounds
-            if round_num >= 100:
-                break
+        winner_idx, current_price, round_num, out_round = _english_kernel(
+            bids, increment, max_rounds=_ENGLISH_MAX_ROUNDS
+        )
+        winner_id = candidates[winner_idx].id
+        winning_bid = bids[winner_idx]
         
-        # Le gagnant est le dernier restant
-        winner_id = active_bidders[0] if active_bidders else max(all_bids, key=all_bids.get)
-        winning_bid = all_bids[winner_id]
+        # Rounds reconstitués seulement s'ils sont demandés
+        rounds = (
+            _english_rounds(candidates, bids, out_round, round_num, increment)
+            if record_rounds else None
+        )
         
         # English: le gagnant paie le prix final (son propre bid effectif)
         price_paid = current_price
@@ -197,14 +264,17 @@ class AuctionMechanism(BaseMechanism):
         return AuctionResult(
             auction_type=AuctionType.ENGLISH,
             winner_id=winner_id,
+            winner_index=winner_idx,
             winning_bid=winning_bid,
             price_paid=price_paid,
             rounds=rounds,
             total_rounds=round_num,
-            all_bids=all_bids
+            bidder_ids=[v.id for v in candidates],
+            bids=bids
         )
     
-    def _run_vickrey_auction(self, candidates: List['Vehicle']) -> AuctionResult:
+    def _run_vickrey_auction(self, candidates: List['Vehicle'], bids: List[int],
+                             record_rounds: bool = False) -> AuctionResult:
         """
         Enchère de Vickrey (Second-Price Sealed-Bid)
         
@@ -215,38 +285,66 @@ class AuctionMechanism(BaseMechanism):
         
         Propriété: Truthful (révéler vraie valeur = optimal)
         """
-        # Collecter tous les bids
-        all_bids = {v.id: v.calculate_bid() for v in candidates}
-        
-        # Trier par bid décroissant
-        sorted_bids = sorted(all_bids.items(), key=lambda x: x[1], reverse=True)
-        
-        # Gagnant = plus haute enchère
-        winner_id, winning_bid = sorted_bids[0]
-        
-        # Prix = 2ème plus haute enchère
-        if len(sorted_bids) > 1:
-            price_paid = sorted_bids[1][1]
-        else:
-            price_paid = 0
+        # Gagnant = plus haute enchère, prix = 2ème plus haute enchère
+        winner_idx, winning_bid, price_paid = _vickrey_top2(bids)
+        winner_id = candidates[winner_idx].id
         
         # Un seul round pour Vickrey
-        round_data = AuctionRound(
-            round_num=1,
-            bids=all_bids,
-            active_bidders=list(all_bids.keys()),
-            current_price=winning_bid,
-            eliminated=[]
-        )
+        rounds = None
+        if record_rounds:
+            rounds = [AuctionRound(
+                round_num=1,
+                bids={v.id: bid for v, bid in zip(candidates, bids)},
+                active_bidders=[v.id for v in candidates],
+                current_price=winning_bid,
+                eliminated=[]
+            )]
         
         return AuctionResult(
             auction_type=AuctionType.VICKREY,
             winner_id=winner_id,
+            winner_index=winner_idx,
             winning_bid=winning_bid,
             price_paid=price_paid,
-            rounds=[round_data],
+            rounds=rounds,
             total_rounds=1,
-            all_bids=all_bids
+            bidder_ids=[v.id for v in candidates],
+            bids=bids
+        )
+    
+    def _run_two_bidder_auction(self, candidates: List['Vehicle'],
+                                bids: List[int]) -> AuctionResult:
+        """
+        Cas à 2 bidders (le plus fréquent), sans log par round.
+        
+        Même issue que le cas général: English s'arrête au round où sort
+        le plus petit bid (le premier bidder gagne les égalités et l'arrêt
+        sur la sécurité), Vickrey fait payer le plus petit bid.
+        """
+        (a, b), (bid_a, bid_b) = candidates, bids
+        low = bid_b if bid_a >= bid_b else bid_a
+        
+        if self.auction_type == AuctionType.ENGLISH:
+            uncapped = low // _ENGLISH_INCREMENT + 1
+            total_rounds = min(uncapped, _ENGLISH_MAX_ROUNDS)
+            price_paid = total_rounds * _ENGLISH_INCREMENT
+            a_wins = bid_a >= bid_b or total_rounds < uncapped
+        else:
+            total_rounds = 1
+            price_paid = low
+            a_wins = bid_a >= bid_b
+        
+        winner_index = 0 if a_wins else 1
+        return AuctionResult(
+            auction_type=self.auction_type,
+            winner_id=candidates[winner_index].id,
+            winner_index=winner_index,
+            winning_bid=bids[winner_index],
+            price_paid=price_paid,
+            rounds=None,
+            total_rounds=total_rounds,
+            bidder_ids=[a.id, b.id],
+            bids=bids
         )
     
     def select_at_conflict(self, waiting: List['Vehicle'], 
@@ -276,9 +374,43 @@ class AuctionMechanism(BaseMechanism):
             self.stats['english_auctions'] += 1
         else:
             self.stats['vickrey_auctions'] += 1
-        
-        if self.stats['auctions_held'] > 0:
-            self.stats['avg_price'] = self.stats['total_revenue'] / self.stats['auctions_held']
+    
+    @property
+    def avg_price(self) -> float:
+        """Prix moyen payé, calculé à la lecture"""
+        held = self.stats['auctions_held']
+        return self.stats['total_revenue'] / held if held else 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques, avec le prix moyen à jour"""
+        stats = super().get_stats()
+        stats['avg_price'] = self.avg_price
+        return stats
+    
+    def _result_to_dict(self, result: AuctionResult) -> Dict:
+        """Convertit le résultat en dictionnaire de détails"""
+        details = {
+            'method': f'{result.auction_type.value}_auction',
+            'winning_bid': result.winning_bid,
+            'price_paid': result.price_paid,
+            'total_rounds': result.total_rounds,
+            'all_bids': result.all_bids,
+        }
+        if result.rounds is not None:
+            details['rounds'] = [
+                {
+                    'round': r.round_num,
+                    'current_price': r.current_price,
+                    'active': r.active_bidders,
+                    'eliminated': r.eliminated
+                }
+                for r in result.rounds
+            ]
+        return details
+    
+    def get_auction_history(self) -> List[AuctionResult]:
+        """Retourne les enchères conservées, de la plus ancienne à la plus récente"""
+        return list(self.auction_history)
     
     def get_last_auction(self) -> Optional[Dict]:
         """Retourne le dernier résultat d'enchère"""
@@ -300,7 +432,6 @@ class AuctionMechanism(BaseMechanism):
         self.stats.update({
             'auctions_held': 0,
             'total_revenue': 0,
-            'avg_price': 0,
             'total_rounds': 0,
             'english_auctions': 0,
             'vickrey_auctions': 0,
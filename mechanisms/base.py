@@ -6,7 +6,7 @@ All selection mechanisms must implement this interface.
 This allows easy addition of new mechanisms without modifying core code.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from vehicle import Vehicle
@@ -14,11 +14,28 @@ if TYPE_CHECKING:
 
 
 class SelectionResult:
-    """Result of a mechanism selection"""
+    """
+    Result of a mechanism selection.
+    
+    Details can be given directly, or as a zero-argument factory that is
+    only called the first time `details` is read (e.g. by the logger).
+    """
     
-    def __init__(self, winner: 'Vehicle', details: Dict[str, Any] = None):
+    __slots__ = ('winner', '_details', '_details_factory')
+    
+    def __init__(self, winner: 'Vehicle', details: Dict[str, Any] = None,
+                 details_factory: Callable[[], Dict[str, Any]] = None):
         self.winner = winner
-        self.details = details or {}
+        self._details = details
+        self._details_factory = details_factory
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        if self._details is None:
+            factory = self._details_factory
+            self._details = factory() if factory else {}
+            self._details_factory = None
+        return self._details
     
     def __repr__(self):
         return f"SelectionResult(winner=V{self.winner.id}, details={self.details})"
@@ -19,8 +19,9 @@ Properties:
 - (Go, Go) is catastrophic (collision)
 - (Yield, Yield) is inefficient but safe
 """
+from collections import deque
 from enum import Enum
-from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Tuple, Deque, TYPE_CHECKING
 from dataclasses import dataclass, field
 import random
 
@@ -46,13 +47,13 @@ class ChickenStrategy(Enum):
     TIT_FOR_TAT = "tit_for_tat"   # Reciprocate opponent's last action
 
 
-@dataclass
+@dataclass(slots=True)
 class ChickenGameOutcome:
     """Result of a Chicken Game interaction"""
     player_a_id: int
     player_b_id: int
-    action_a: ChickenAction
-    action_b: ChickenAction
+    action_a: int  # action code: 0 = YIELD, 1 = GO
+    action_b: int
     payoff_a: int
     payoff_b: int
     winner_id: Optional[int]
@@ -68,6 +69,26 @@ PAYOFF_MATRIX = {
     (ChickenAction.GO, ChickenAction.GO): (-10, -10),      # COLLISION!
 }
 
+# Integer action codes (YIELD=0, GO=1), and the same payoffs as a
+# 2x2 table indexed [code_a][code_b]
+_YIELD, _GO = ChickenAction.YIELD, ChickenAction.GO  # for the decision hot paths
+_ACTION_CODE = {_YIELD: 0, _GO: 1}
+_ACTIONS = (_YIELD, _GO)
+_ACTION_NAMES = tuple(a.value for a in _ACTIONS)
+_PAYOFF_TABLE = (
+    (PAYOFF_MATRIX[(ChickenAction.YIELD, ChickenAction.YIELD)],
+     PAYOFF_MATRIX[(ChickenAction.YIELD, ChickenAction.GO)]),
+    (PAYOFF_MATRIX[(ChickenAction.GO, ChickenAction.YIELD)],
+     PAYOFF_MATRIX[(ChickenAction.GO, ChickenAction.GO)]),
+)
+
+
+# Bound once: same global generator (and seed) as random.random()
+_random = random.random
+
+# Sentinel for classes not yet looked up in the decision cache
+_MISSING = object()
+
 
 class ChickenGameMechanism(BaseMechanism):
     """
@@ -80,9 +101,12 @@ class ChickenGameMechanism(BaseMechanism):
     - Pure Strategy Nash Equilibria: (Go, Yield) and (Yield, Go)
     - Mixed Strategy Equilibrium: Each player randomizes
     - No dominant strategy exists
+    
+    History keeps the last `history_size` games (None = full history).
     """
     
-    def __init__(self, default_strategy: ChickenStrategy = ChickenStrategy.RATIONAL):
+    def __init__(self, default_strategy: ChickenStrategy = ChickenStrategy.RATIONAL,
+                 history_size: Optional[int] = 256):
         super().__init__()
         self.name = "Chicken Game"
         self.default_strategy = default_strategy
@@ -99,8 +123,11 @@ class ChickenGameMechanism(BaseMechanism):
             'yield_count': 0,
         })
         
-        self.history: List[ChickenGameOutcome] = []
+        self.history: Deque[ChickenGameOutcome] = deque(maxlen=history_size)
         self.last_outcome: Optional[ChickenGameOutcome] = None
+        
+        # Vehicle class -> its chicken_game_decision function (or None)
+        self._decision_fn_cache: Dict[type, Any] = {}
     
     def select(self, candidates: List['Vehicle'], axis: 'CorridorAxis', 
                context: Dict[str, Any] = None) -> Optional[SelectionResult]:
@@ -134,8 +161,8 @@ class ChickenGameMechanism(BaseMechanism):
             winner=winner,
             details={
                 'method': 'chicken_game',
-                'action_a': outcome.action_a.value,
-                'action_b': outcome.action_b.value,
+                'action_a': _ACTION_NAMES[outcome.action_a],
+                'action_b': _ACTION_NAMES[outcome.action_b],
                 'payoff_a': outcome.payoff_a,
                 'payoff_b': outcome.payoff_b,
                 'is_collision': outcome.is_collision,
@@ -154,40 +181,44 @@ class ChickenGameMechanism(BaseMechanism):
         """
         Play one round of Chicken Game between two vehicles.
         """
+        # Urgencies read once for both decisions and the near-miss override
+        u1, u2 = v1.urgency, v2.urgency
+        
         # Get actions from each vehicle
-        action1 = self._get_action(v1, v2.urgency)
-        action2 = self._get_action(v2, v1.urgency)
+        action1 = self._get_action(v1, u2)
+        action2 = self._get_action(v2, u1)
         
         # Look up payoffs
-        payoff1, payoff2 = PAYOFF_MATRIX[(action1, action2)]
+        a1, a2 = _ACTION_CODE[action1], _ACTION_CODE[action2]
+        payoff1, payoff2 = _PAYOFF_TABLE[a1][a2]
         
         # Determine outcome
-        is_collision = (action1 == ChickenAction.GO and action2 == ChickenAction.GO)
-        is_deadlock = (action1 == ChickenAction.YIELD and action2 == ChickenAction.YIELD)
+        is_collision = bool(a1 & a2)
+        is_deadlock = not (a1 | a2)
         
         # Determine winner
         winner_id = None
-        if action1 == ChickenAction.GO and action2 == ChickenAction.YIELD:
+        if a1 > a2:
             winner_id = v1.id
-        elif action1 == ChickenAction.YIELD and action2 == ChickenAction.GO:
+        elif a2 > a1:
             winner_id = v2.id
         elif is_collision:
             # COLLISION PREVENTION: Override to avoid actual collision
             # In reality, we prevent this by having one yield
             # This simulates the "near miss" scenario
-            if v1.urgency >= v2.urgency:
-                action2 = ChickenAction.YIELD  # Force v2 to yield
+            if u1 >= u2:
+                a2 = 0  # Force v2 to yield
                 winner_id = v1.id
             else:
-                action1 = ChickenAction.YIELD  # Force v1 to yield
+                a1 = 0  # Force v1 to yield
                 winner_id = v2.id
             payoff1, payoff2 = -5, -5  # Near miss penalty
         
         outcome = ChickenGameOutcome(
             player_a_id=v1.id,
             player_b_id=v2.id,
-            action_a=action1,
-            action_b=action2,
+            action_a=a1,
+            action_b=a2,
             payoff_a=payoff1,
             payoff_b=payoff2,
             winner_id=winner_id,
@@ -204,10 +235,16 @@ class ChickenGameMechanism(BaseMechanism):
         """
         Determine vehicle's action based on strategy.
         """
-        # Use vehicle's BDI if available
-        if hasattr(vehicle, 'chicken_game_decision'):
-            decision = vehicle.chicken_game_decision(other_urgency)
-            return ChickenAction.GO if decision == 'go' else ChickenAction.YIELD
+        # Use vehicle's BDI if available (looked up once per class)
+        cls = type(vehicle)
+        fn = self._decision_fn_cache.get(cls, _MISSING)
+        if fn is _MISSING:
+            fn = getattr(cls, 'chicken_game_decision', None)
+            self._decision_fn_cache[cls] = fn
+        
+        if fn is not None:
+            decision = fn(vehicle, other_urgency)
+            return _GO if decision == 'go' else _YIELD
         
         # Otherwise use default strategy
         return self._apply_strategy(vehicle.urgency, other_urgency)
@@ -217,15 +254,15 @@ class ChickenGameMechanism(BaseMechanism):
         Apply strategy to determine action.
         """
         if self.default_strategy == ChickenStrategy.AGGRESSIVE:
-            return ChickenAction.GO
+            return _GO
         
         elif self.default_strategy == ChickenStrategy.COOPERATIVE:
-            return ChickenAction.YIELD
+            return _YIELD
         
         elif self.default_strategy == ChickenStrategy.MIXED:
             # Mixed strategy: probability of GO proportional to urgency
             p_go = own_urgency / 10.0
-            return ChickenAction.GO if random.random() < p_go else ChickenAction.YIELD
+            return _GO if _random() < p_go else _YIELD
         
         elif self.default_strategy == ChickenStrategy.RATIONAL:
             # Rational: based on expected utility
@@ -237,17 +274,17 @@ class ChickenGameMechanism(BaseMechanism):
             # Adjust for own urgency
             eu_go += own_urgency * 0.3
             
-            return ChickenAction.GO if eu_go > eu_yield else ChickenAction.YIELD
+            return _GO if eu_go > eu_yield else _YIELD
         
         elif self.default_strategy == ChickenStrategy.TIT_FOR_TAT:
             # Start cooperative, then mirror opponent's last action
             if self.history:
                 last = self.history[-1]
                 # Mirror what opponent did
-                return last.action_b  # Assuming we're player A
-            return ChickenAction.YIELD  # Start cooperative
+                return _ACTIONS[last.action_b]  # Assuming we're player A
+            return _YIELD  # Start cooperative
         
-        return ChickenAction.YIELD  # Default to safe
+        return _YIELD  # Default to safe
     
     def _update_stats(self, outcome: ChickenGameOutcome):
         """Update statistics after a game"""
@@ -263,15 +300,9 @@ class ChickenGameMechanism(BaseMechanism):
         self.stats['total_payoff_a'] += outcome.payoff_a
         self.stats['total_payoff_b'] += outcome.payoff_b
         
-        if outcome.action_a == ChickenAction.GO:
-            self.stats['go_count'] += 1
-        else:
-            self.stats['yield_count'] += 1
-        
-        if outcome.action_b == ChickenAction.GO:
-            self.stats['go_count'] += 1
-        else:
-            self.stats['yield_count'] += 1
+        go = outcome.action_a + outcome.action_b
+        self.stats['go_count'] += go
+        self.stats['yield_count'] += 2 - go
     
     def get_nash_equilibria(self) -> List[Tuple[ChickenAction, ChickenAction]]:
         """
@@ -341,8 +372,8 @@ class ChickenGameMechanism(BaseMechanism):
         return {
             'player_a': o.player_a_id,
             'player_b': o.player_b_id,
-            'action_a': o.action_a.value,
-            'action_b': o.action_b.value,
+            'action_a': _ACTION_NAMES[o.action_a],
+            'action_b': _ACTION_NAMES[o.action_b],
             'payoff_a': o.payoff_a,
             'payoff_b': o.payoff_b,
             'winner': o.winner_id,
@@ -27,13 +27,16 @@ class FCFSMechanism(BaseMechanism):
         if not candidates:
             return None
         
-        # Correction: Ajout de v.id pour le départage (Tie-Breaker)
-        sorted_candidates = sorted(
-            candidates,
-            key=lambda v: (v.barrier_time or v.arrival_time, v.arrival_time, v.id)
-        )
+        if len(candidates) == 1:
+            # Un seul candidat: pas de tri
+            winner = candidates[0]
+        else:
+            # Correction: Ajout de v.id pour le départage (Tie-Breaker)
+            winner = min(
+                candidates,
+                key=lambda v: (v.barrier_time or v.arrival_time, v.arrival_time, v.id)
+            )
         
-        winner = sorted_candidates[0]
         self.stats['selections'] += 1
         
         return SelectionResult(
@@ -59,8 +62,7 @@ class FCFSMechanism(BaseMechanism):
         
         # Correction: Ajout de v.id pour le départage explicite
         # Si entry_time est égal, le véhicule avec le plus petit ID gagne
-        sorted_waiting = sorted(waiting, key=lambda v: (v.entry_time or 0, v.id))
-        winner = sorted_waiting[0]
+        winner = min(waiting, key=lambda v: (v.entry_time or 0, v.id))
         
         self.stats['conflict_selections'] += 1
         
@@ -16,9 +16,12 @@ Critères équilibrés:
   - Fuel (15%): Niveau de carburant
   - Tiebreaker (10%): Facteur aléatoire
 """
+import heapq
 import random
+from collections import deque
 from enum import Enum
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from functools import partial
+from typing import Optional, List, Dict, Any, Callable, Deque, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 from mechanisms.base import BaseMechanism, SelectionResult
@@ -27,6 +30,20 @@ if TYPE_CHECKING:
     from vehicle import Vehicle
     from constants import CorridorAxis
 
+# Bound once: same global generator (and seed) as random.random()
+_random = random.random
+
+# Composants de score arrondis à 0.1 pour l'affichage
+_SCORE_KEYS = ('urgency_score', 'wait_score', 'fuel_score', 'random_score')
+
+
+def _rounded_components(components: Dict[str, Any]) -> Dict[str, Any]:
+    """Copie des composants avec les scores arrondis (UI, logs)"""
+    rounded = dict(components)
+    for key in _SCORE_KEYS:
+        rounded[key] = round(rounded[key], 1)
+    return rounded
+
 
 class MessageType(Enum):
     """Types de messages dans le protocole de négociation"""
@@ -38,7 +55,7 @@ class MessageType(Enum):
     ACCEPT = "accept"         # Finalisation
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Message échangé entre véhicules"""
     round: int
@@ -49,7 +66,7 @@ class Message:
     timestamp: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class NegotiationRound:
     """Un round de négociation"""
     round_num: int
@@ -58,18 +75,32 @@ class NegotiationRound:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NegotiationResult:
-    """Résultat complet d'une négociation"""
+    """
+    Résultat complet d'une négociation.
+    
+    Les rounds (messages, descriptions) ne sont construits que lorsque
+    `rounds` est lu (UI, logs): la décision n'en a pas besoin.
+    """
     winner_id: int
     loser_id: int
     winner_score: float
     loser_score: float
     total_rounds: int
     total_messages: int
-    rounds: List[NegotiationRound]
     winner_components: Dict[str, Any]
     loser_components: Dict[str, Any]
+    _rounds_factory: Optional[Callable[[], List[NegotiationRound]]] = field(default=None, repr=False)
+    _rounds: Optional[List[NegotiationRound]] = field(default=None, repr=False)
+    
+    @property
+    def rounds(self) -> List[NegotiationRound]:
+        if self._rounds is None:
+            factory = self._rounds_factory
+            self._rounds = factory() if factory else []
+            self._rounds_factory = None
+        return self._rounds
 
 
 class NegotiationMechanism(BaseMechanism):
@@ -79,9 +110,12 @@ class NegotiationMechanism(BaseMechanism):
     Équilibre entre URGENCE et ÉQUITÉ (fairness):
     - Urgence: véhicules prioritaires (ambulances) passent plus vite
     - Équité: véhicules qui attendent longtemps gagnent en priorité
+    
+    L'historique garde les `history_size` dernières négociations
+    (None = historique complet).
     """
     
-    def __init__(self):
+    def __init__(self, history_size: Optional[int] = 256):
         super().__init__()
         self.name = "Negotiation"
         
@@ -96,7 +130,7 @@ class NegotiationMechanism(BaseMechanism):
         })
         
         self.last_negotiation: Optional[NegotiationResult] = None
-        self.negotiation_history: List[NegotiationResult] = []
+        self.negotiation_history: Deque[NegotiationResult] = deque(maxlen=history_size)
     
     def select(self, candidates: List['Vehicle'], axis: 'CorridorAxis', 
                context: Dict[str, Any] = None) -> Optional[SelectionResult]:
@@ -115,19 +149,13 @@ class NegotiationMechanism(BaseMechanism):
         context = context or {}
         current_step = context.get('current_step', 0)
         
-        # Prendre les 2 meilleurs candidats par bid
-        sorted_candidates = sorted(
-            candidates, 
-            key=lambda v: v.calculate_bid(), 
-            reverse=True
-        )
-        v1, v2 = sorted_candidates[0], sorted_candidates[1]
+        # Prendre les 2 meilleurs candidats par bid (bids lus une seule fois)
+        bids = [v.bid for v in candidates]
+        i1, i2 = heapq.nlargest(2, range(len(candidates)), key=bids.__getitem__)
+        v1, v2 = candidates[i1], candidates[i2]
         
-        # Exécuter la négociation multi-rounds
-        result = self._run_negotiation(v1, v2, current_step)
-        
-        # Trouver le gagnant
-        winner = v1 if result.winner_id == v1.id else v2
+        # Exécuter la négociation multi-rounds (renvoie aussi le gagnant)
+        result, winner = self._run_negotiation(v1, v2, current_step)
         
         # Mettre à jour les stats
         self._update_stats(result)
@@ -136,9 +164,10 @@ class NegotiationMechanism(BaseMechanism):
         self.last_negotiation = result
         self.negotiation_history.append(result)
         
+        # Détails construits seulement s'ils sont lus (logs, UI)
         return SelectionResult(
             winner=winner,
-            details=self._result_to_dict(result)
+            details_factory=lambda: self._result_to_dict(result)
         )
     
     def select_at_conflict(self, waiting: List['Vehicle'], 
@@ -161,9 +190,7 @@ class NegotiationMechanism(BaseMechanism):
         v1, v2 = waiting[0], waiting[1]
         
         # Exécuter la négociation
-        result = self._run_negotiation(v1, v2, current_step)
-        
-        winner = v1 if result.winner_id == v1.id else v2
+        result, winner = self._run_negotiation(v1, v2, current_step)
         
         self._update_stats(result)
         self.last_negotiation = result
@@ -171,27 +198,75 @@ class NegotiationMechanism(BaseMechanism):
         
         return SelectionResult(
             winner=winner,
-            details=self._result_to_dict(result)
+            details_factory=lambda: self._result_to_dict(result)
         )
     
     def _run_negotiation(self, v1: 'Vehicle', v2: 'Vehicle', 
-                         current_step: int) -> NegotiationResult:
+                         current_step: int) -> Tuple[NegotiationResult, 'Vehicle']:
         """
         Exécute une négociation complète multi-rounds.
         
+        Retourne le résultat et le véhicule gagnant (v1 ou v2).
+        
         Rounds:
         1. ANNOUNCE: Les véhicules annoncent leur intention de passer
         2. PROPOSE: Échange des scores de priorité
         3. COUNTER: Si scores proches (<10%), contre-propositions
         4. DECIDE: YIELD (céder) ou INSIST (insister)
-        """
-        all_rounds = []
-        all_messages = []
         
+        Seuls les scores et la décision sont calculés ici; les messages
+        de chaque round sont reconstruits par _build_rounds à la lecture.
+        """
         # Calculer les scores initiaux
         score1, comp1 = self._calculate_priority_score(v1, current_step)
         score2, comp2 = self._calculate_priority_score(v2, current_step)
         
+        # ROUND 3: COUNTER si scores proches (bonus équité)
+        diff_percent = abs(score1 - score2) / max(score1, score2, 1) * 100
+        close = diff_percent < 10
+        if close:
+            final1 = score1 + (comp1['wait_time'] * 0.3)
+            final2 = score2 + (comp2['wait_time'] * 0.3)
+        else:
+            final1, final2 = score1, score2
+        
+        # ROUND 4: DECIDE
+        # Une seule comparaison: (gagnant, perdant) avec scores et composants
+        if final1 >= final2:
+            winner, loser = v1, v2
+            winner_score, loser_score = final1, final2
+            winner_comp, loser_comp = comp1, comp2
+        else:
+            winner, loser = v2, v1
+            winner_score, loser_score = final2, final1
+            winner_comp, loser_comp = comp2, comp1
+        
+        total_rounds = 4 if close else 3
+        result = NegotiationResult(
+            winner_id=winner.id,
+            loser_id=loser.id,
+            winner_score=winner_score,
+            loser_score=loser_score,
+            total_rounds=total_rounds,
+            total_messages=2 * total_rounds,  # 2 messages par round
+            winner_components=winner_comp,
+            loser_components=loser_comp,
+            _rounds_factory=partial(
+                self._build_rounds, v1, v2, current_step,
+                score1, comp1, score2, comp2, close, final1, final2, winner
+            )
+        )
+        return result, winner
+    
+    @staticmethod
+    def _build_rounds(v1: 'Vehicle', v2: 'Vehicle', current_step: int,
+                      score1: float, comp1: Dict[str, Any],
+                      score2: float, comp2: Dict[str, Any], close: bool,
+                      final1: float, final2: float,
+                      winner: 'Vehicle') -> List[NegotiationRound]:
+        """Reconstruit les messages et rounds d'une négociation"""
+        all_rounds = []
+        
         # =============== ROUND 1: ANNOUNCE ===============
         msg1 = Message(
             round=1, sender_id=v1.id, receiver_id=v2.id,
@@ -213,7 +288,6 @@ class NegotiationMechanism(BaseMechanism):
             },
             timestamp=current_step
         )
-        all_messages.extend([msg1, msg2])
         
         round1 = NegotiationRound(
             round_num=1,
@@ -229,9 +303,9 @@ class NegotiationMechanism(BaseMechanism):
             msg_type=MessageType.PROPOSE,
             content={
                 'priority_score': score1,
-                'urgency_factor': comp1['urgency_score'],
-                'fairness_factor': comp1['wait_score'],
-                'fuel_factor': comp1['fuel_score'],
+                'urgency_factor': round(comp1['urgency_score'], 1),
+                'fairness_factor': round(comp1['wait_score'], 1),
+                'fuel_factor': round(comp1['fuel_score'], 1),
             },
             timestamp=current_step
         )
@@ -240,13 +314,12 @@ class NegotiationMechanism(BaseMechanism):
             msg_type=MessageType.PROPOSE,
             content={
                 'priority_score': score2,
-                'urgency_factor': comp2['urgency_score'],
-                'fairness_factor': comp2['wait_score'],
-                'fuel_factor': comp2['fuel_score'],
+                'urgency_factor': round(comp2['urgency_score'], 1),
+                'fairness_factor': round(comp2['wait_score'], 1),
+                'fuel_factor': round(comp2['fuel_score'], 1),
             },
             timestamp=current_step
         )
-        all_messages.extend([msg3, msg4])
         
         round2 = NegotiationRound(
             round_num=2,
@@ -257,24 +330,16 @@ class NegotiationMechanism(BaseMechanism):
         all_rounds.append(round2)
         
         # =============== ROUND 3: COUNTER (si scores proches) ===============
-        diff_percent = abs(score1 - score2) / max(score1, score2, 1) * 100
-        
-        if diff_percent < 10:
-            # Scores proches - contre-propositions
-            self.stats['close_negotiations'] += 1
-            
-            # V1 contre-propose avec bonus équité
-            wait1 = current_step - v1.arrival_time
-            adjusted_score1 = score1 + (wait1 * 0.3)
-            
-            wait2 = current_step - v2.arrival_time
-            adjusted_score2 = score2 + (wait2 * 0.3)
+        if close:
+            # Chaque véhicule contre-propose avec bonus équité
+            wait1 = comp1['wait_time']
+            wait2 = comp2['wait_time']
             
             msg5 = Message(
                 round=3, sender_id=v1.id, receiver_id=v2.id,
                 msg_type=MessageType.COUNTER,
                 content={
-                    'adjusted_score': adjusted_score1,
+                    'adjusted_score': final1,
                     'wait_time_bonus': wait1 * 0.3,
                     'argument': 'fairness_bonus',
                 },
@@ -284,104 +349,61 @@ class NegotiationMechanism(BaseMechanism):
                 round=3, sender_id=v2.id, receiver_id=v1.id,
                 msg_type=MessageType.COUNTER,
                 content={
-                    'adjusted_score': adjusted_score2,
+                    'adjusted_score': final2,
                     'wait_time_bonus': wait2 * 0.3,
                     'argument': 'fairness_bonus',
                 },
                 timestamp=current_step
             )
-            all_messages.extend([msg5, msg6])
             
             round3 = NegotiationRound(
                 round_num=3,
                 messages=[msg5, msg6],
-                scores={v1.id: adjusted_score1, v2.id: adjusted_score2},
-                description=f"Scores proches! V{v1.id}→{adjusted_score1:.1f}, V{v2.id}→{adjusted_score2:.1f}"
+                scores={v1.id: final1, v2.id: final2},
+                description=f"Scores proches! V{v1.id}→{final1:.1f}, V{v2.id}→{final2:.1f}"
             )
             all_rounds.append(round3)
-            
-            # Utiliser les scores ajustés
-            score1, score2 = adjusted_score1, adjusted_score2
         
         # =============== ROUND 4: DECIDE ===============
-        if score1 >= score2:
-            winner_id, loser_id = v1.id, v2.id
-            winner_score, loser_score = score1, score2
-            winner_comp, loser_comp = comp1, comp2
-            
-            # Le perdant cède (YIELD)
-            msg_yield = Message(
-                round=4, sender_id=v2.id, receiver_id=v1.id,
-                msg_type=MessageType.YIELD,
-                content={
-                    'decision': 'yield_passage',
-                    'my_score': score2,
-                    'winner_score': score1,
-                    'reason': 'lower_priority'
-                },
-                timestamp=current_step
-            )
-            self.stats['yields'] += 1
-            
-            # Le gagnant accepte
-            msg_accept = Message(
-                round=4, sender_id=v1.id, receiver_id=v2.id,
-                msg_type=MessageType.ACCEPT,
-                content={
-                    'decision': 'proceed',
-                    'final_score': score1
-                },
-                timestamp=current_step
-            )
+        if winner is v1:
+            loser, winner_score, loser_score = v2, final1, final2
         else:
-            winner_id, loser_id = v2.id, v1.id
-            winner_score, loser_score = score2, score1
-            winner_comp, loser_comp = comp2, comp1
-            
-            msg_yield = Message(
-                round=4, sender_id=v1.id, receiver_id=v2.id,
-                msg_type=MessageType.YIELD,
-                content={
-                    'decision': 'yield_passage',
-                    'my_score': score1,
-                    'winner_score': score2,
-                    'reason': 'lower_priority'
-                },
-                timestamp=current_step
-            )
-            self.stats['yields'] += 1
-            
-            msg_accept = Message(
-                round=4, sender_id=v2.id, receiver_id=v1.id,
-                msg_type=MessageType.ACCEPT,
-                content={
-                    'decision': 'proceed',
-                    'final_score': score2
-                },
-                timestamp=current_step
-            )
+            loser, winner_score, loser_score = v1, final2, final1
+        winner_id, loser_id = winner.id, loser.id
         
-        all_messages.extend([msg_yield, msg_accept])
+        # Le perdant cède (YIELD)
+        msg_yield = Message(
+            round=4, sender_id=loser_id, receiver_id=winner_id,
+            msg_type=MessageType.YIELD,
+            content={
+                'decision': 'yield_passage',
+                'my_score': loser_score,
+                'winner_score': winner_score,
+                'reason': 'lower_priority'
+            },
+            timestamp=current_step
+        )
+        
+        # Le gagnant accepte
+        msg_accept = Message(
+            round=4, sender_id=winner_id, receiver_id=loser_id,
+            msg_type=MessageType.ACCEPT,
+            content={
+                'decision': 'proceed',
+                'final_score': winner_score
+            },
+            timestamp=current_step
+        )
         
         round4 = NegotiationRound(
             round_num=4,
             messages=[msg_yield, msg_accept],
-            scores={v1.id: score1, v2.id: score2},
+            scores={v1.id: final1, v2.id: final2},
             description=f"V{loser_id} YIELD → V{winner_id} PROCEED"
         )
         all_rounds.append(round4)
         
-        return NegotiationResult(
-            winner_id=winner_id,
-            loser_id=loser_id,
-            winner_score=winner_score,
-            loser_score=loser_score,
-            total_rounds=len(all_rounds),
-            total_messages=len(all_messages),
-            rounds=all_rounds,
-            winner_components=winner_comp,
-            loser_components=loser_comp
-        )
+        return all_rounds
     
     def _calculate_priority_score(self, v: 'Vehicle', current_step: int) -> tuple:
         """
@@ -408,32 +430,39 @@ class NegotiationMechanism(BaseMechanism):
         fuel_score = fuel_urgency * 15
         
         # Random tiebreaker (10%)
-        random_score = random.random() * 10
+        random_score = _random() * 10
         
         total_score = urgency_score + wait_score + fuel_score + random_score
         
+        # Composants bruts: arrondis seulement à l'affichage (_rounded_components)
         components = {
             'urgency': v.urgency,
-            'urgency_score': round(urgency_score, 1),
+            'urgency_score': urgency_score,
             'wait_time': wait_time,
-            'wait_score': round(wait_score, 1),
+            'wait_score': wait_score,
             'fuel_level': v.fuel_level,
-            'fuel_score': round(fuel_score, 1),
-            'random_score': round(random_score, 1),
+            'fuel_score': fuel_score,
+            'random_score': random_score,
         }
         
         return round(total_score, 1), components
     
     def _update_stats(self, result: NegotiationResult):
-        """Met à jour les statistiques"""
-        self.stats['negotiations_held'] += 1
-        self.stats['total_rounds'] += result.total_rounds
-        self.stats['total_messages'] += result.total_messages
-        
-        if self.stats['negotiations_held'] > 0:
-            self.stats['avg_rounds'] = round(
-                self.stats['total_rounds'] / self.stats['negotiations_held'], 1
-            )
+        """Met à jour les statistiques (seul endroit où elles changent)"""
+        stats = self.stats
+        stats['negotiations_held'] += 1
+        stats['total_rounds'] += result.total_rounds
+        stats['total_messages'] += result.total_messages
+        
+        # Le perdant cède toujours au round DECIDE
+        stats['yields'] += 1
+        # 4 rounds = scores proches, le round COUNTER a été joué
+        if result.total_rounds == 4:
+            stats['close_negotiations'] += 1
+        
+        stats['avg_rounds'] = round(
+            stats['total_rounds'] / stats['negotiations_held'], 1
+        )
     
     def _result_to_dict(self, result: NegotiationResult) -> Dict:
         """Convertit le résultat en dictionnaire"""
@@ -445,8 +474,8 @@ class NegotiationMechanism(BaseMechanism):
             'loser_score': result.loser_score,
             'total_rounds': result.total_rounds,
             'total_messages': result.total_messages,
-            'winner_components': result.winner_components,
-            'loser_components': result.loser_components,
+            'winner_components': _rounded_components(result.winner_components),
+            'loser_components': _rounded_components(result.loser_components),
             'rounds_detail': [
                 {
                     'round': r.round_num,
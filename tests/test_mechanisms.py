@@ -3,14 +3,43 @@ Test Suite for Intersection Mechanisms
 ======================================
 
 Validates that FCFS and AUCTION mechanisms work correctly.
+
+Run with: python -m pytest -q tests/  (pytest: see requirements-dev.txt)
 """
 import sys
 sys.path.insert(0, '.')
 
-from constants import Mechanism, VehicleState, CorridorAxis
+import pytest
+
+from constants import Mechanism, VehicleState, VehicleType, CorridorAxis, WAITING_POSITIONS
 from vehicle import Vehicle
-from mechanisms import FCFSMechanism, AuctionMechanism, NegotiationMechanism, NegotiationType
+from mechanisms import FCFSMechanism, AuctionMechanism, AuctionType, NegotiationMechanism, NegotiationType
+from mechanisms.auction import _english_kernel, _english_rounds
 from intersection import SimpleIntersection
+from debug import logger
+
+
+SEED = 42
+SWEEP_STEPS = 100
+
+
+@pytest.fixture(scope="module", autouse=True)
+def isolated_debug_log(tmp_path_factory):
+    """Write the global logger's file to a temp dir, not the tracked ./debug.log"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(logger, 'log_file', str(tmp_path_factory.mktemp('logs') / 'debug.log'))
+        yield
+
+
+@pytest.fixture(scope="module")
+def seeded_runs():
+    """Seeded 100-step FCFS/AUCTION runs, shared by the fairness and sweep tests"""
+    return {
+        mechanism: SimpleIntersection(
+            mechanism=mechanism, spawn_rate=0.3, seed=SEED
+        ).run(SWEEP_STEPS)
+        for mechanism in (Mechanism.FCFS, Mechanism.AUCTION)
+    }
 
 
 def test_fcfs_priority():
@@ -67,6 +96,8 @@ def test_auction_highest_bid_wins():
     
     assert result.winner.id == 2, f"Expected V2 (highest bid), got V{result.winner.id}"
     assert result.details['price_paid'] == 50, f"Expected 2nd price (50), got {result.details['price_paid']}"
+    assert mech.get_stats()['avg_price'] == 50
+    assert 'avg_price' not in mech.stats  # computed on read, never stored stale
     print("✅ Auction correctly selects highest bidder")
     print("✅ Vickrey pricing (2nd price) works correctly")
     print()
@@ -97,6 +128,188 @@ def test_auction_urgent_priority():
     print()
 
 
+def _reference_english(bids, increment, max_rounds):
+    """Round-by-round English auction, as originally implemented (ids = index)"""
+    active = list(range(len(bids)))
+    rounds = []
+    price = 0
+    round_num = 0
+    while len(active) > 1:
+        round_num += 1
+        price += increment
+        new_active = [i for i in active if bids[i] >= price]
+        eliminated = [i for i in active if bids[i] < price]
+        rounds.append((round_num, {i: min(bids[i], price) for i in active},
+                       new_active, price, eliminated))
+        active = new_active
+        if round_num >= max_rounds:
+            break
+    winner = active[0] if active else max(range(len(bids)), key=bids.__getitem__)
+    return winner, price, round_num, rounds
+
+
+class _Bidder:
+    """Minimal candidate for _english_rounds (only .id is read)"""
+    def __init__(self, vid):
+        self.id = vid
+
+
+@pytest.mark.parametrize("bids, increment, max_rounds", [
+    ([30, 80, 50], 10, 100),          # distinct bids
+    ([80, 80, 50], 10, 100),          # tied top bids
+    ([50, 80, 80], 10, 100),          # tied top bids, not first
+    ([0, 0], 10, 100),                # everyone out in round 1
+    ([1010, 1009, 40], 10, 100),      # second // increment above the cap
+    ([1009, 1010], 10, 100),          # capped: first active bidder wins
+    ([1000, 1005], 10, 100),          # capped, first bid exactly at the cap price
+    ([35, 72, 72, 10], 7, 100),       # increment > 1, not dividing bids
+    ([100, 90, 20], 3, 5),            # small cap, increment 3
+])
+def test_english_kernel_matches_round_loop(bids, increment, max_rounds):
+    """Test the closed-form English auction against the round-by-round loop"""
+    print("=" * 60)
+    print(f"TEST: English Kernel {bids} (increment={increment}, cap={max_rounds})")
+    print("=" * 60)
+    
+    winner, price, total, ref_rounds = _reference_english(bids, increment, max_rounds)
+    k_winner, k_price, k_total, out_round = _english_kernel(bids, increment, max_rounds)
+    print(f"Loop: V{winner} pays {price} after {total} rounds")
+    print(f"Kernel: V{k_winner} pays {k_price} after {k_total} rounds")
+    assert (k_winner, k_price, k_total) == (winner, price, total)
+    
+    rounds = _english_rounds([_Bidder(i) for i in range(len(bids))],
+                             bids, out_round, k_total, increment)
+    assert [
+        (r.round_num, r.bids, r.active_bidders, r.current_price, r.eliminated)
+        for r in rounds
+    ] == ref_rounds
+    
+    print("✅ Same winner, price and round log as the round loop")
+    print()
+
+
+def test_english_recorded_rounds():
+    """Test select() round details with record_rounds=True"""
+    print("=" * 60)
+    print("TEST: English Recorded Rounds")
+    print("=" * 60)
+    
+    mech = AuctionMechanism(AuctionType.ENGLISH)
+    vehicles = [
+        Vehicle(1, 'N', arrival_time=0, urgency=3, mechanism=Mechanism.AUCTION),  # bid = 30
+        Vehicle(2, 'S', arrival_time=0, urgency=5, mechanism=Mechanism.AUCTION),  # bid = 50
+        Vehicle(3, 'N', arrival_time=0, urgency=5, mechanism=Mechanism.AUCTION),  # bid = 50
+    ]
+    result = mech.select(vehicles, CorridorAxis.NS, {'record_rounds': True})
+    details = result.details
+    
+    bids = [v.bid for v in vehicles]
+    winner, price, total, ref_rounds = _reference_english(bids, 10, 100)
+    print(f"Winner: V{result.winner.id}, price={details['price_paid']}, rounds={details['total_rounds']}")
+    
+    assert result.winner is vehicles[winner]
+    assert details['price_paid'] == price
+    assert details['total_rounds'] == total
+    assert details['rounds'] == [
+        {
+            'round': num,
+            'current_price': round_price,
+            'active': [vehicles[i].id for i in active],
+            'eliminated': [vehicles[i].id for i in eliminated],
+        }
+        for num, _, active, round_price, eliminated in ref_rounds
+    ]
+    
+    print("✅ Recorded rounds match the round loop")
+    print()
+
+
+@pytest.mark.parametrize("auction_type", list(AuctionType), ids=lambda t: t.value)
+@pytest.mark.parametrize("urgencies", [
+    (3, 8),     # unequal (30 vs 80)
+    (8, 3),     # unequal, winner first
+    (5, 5),     # equal bids
+    (9, 10),    # both urgent: English capped at 100 rounds
+    (10, 10),   # both urgent, equal
+], ids=str)
+def test_two_bidder_fast_path(auction_type, urgencies):
+    """Test the 2-bidder fast path against the general auction path"""
+    print("=" * 60)
+    print(f"TEST: Two-Bidder Fast Path ({auction_type.value}, urgencies={urgencies})")
+    print("=" * 60)
+    
+    vehicles = [
+        Vehicle(i + 1, 'N', arrival_time=0, urgency=u, mechanism=Mechanism.AUCTION)
+        for i, u in enumerate(urgencies)
+    ]
+    
+    # record_rounds=True forces the general (multi-bidder) path
+    fast = AuctionMechanism(auction_type).select(vehicles, CorridorAxis.NS, {})
+    general = AuctionMechanism(auction_type).select(
+        vehicles, CorridorAxis.NS, {'record_rounds': True}
+    )
+    print(f"Fast: V{fast.winner.id} pays {fast.details['price_paid']}")
+    print(f"General: V{general.winner.id} pays {general.details['price_paid']}")
+    
+    assert fast.winner is general.winner
+    for key in ('winning_bid', 'price_paid', 'total_rounds', 'all_bids'):
+        assert fast.details[key] == general.details[key], key
+    
+    print("✅ Fast path matches the general auction")
+    print()
+
+
+def test_bid_tracks_urgency_changes():
+    """Test that the memoized bid follows later urgency/type changes"""
+    print("=" * 60)
+    print("TEST: Bid Tracks Urgency Changes")
+    print("=" * 60)
+    
+    v = Vehicle(1, 'N', arrival_time=0, urgency=3, mechanism=Mechanism.AUCTION)
+    assert v.bid == 30
+    
+    v.urgency = 7
+    print(f"After urgency=7: bid={v.bid}")
+    assert v.bid == 70, f"Expected 70, got {v.bid}"
+    
+    v.vehicle_type = VehicleType.URGENT
+    print(f"After URGENT: bid={v.bid}")
+    assert v.bid == 1007, f"Expected 1007, got {v.bid}"
+    
+    print("✅ Memoized bid is invalidated on change")
+    print()
+
+
+def test_bid_out_of_range_and_fcfs():
+    """Test bids for urgencies outside the lookup table and for FCFS"""
+    print("=" * 60)
+    print("TEST: Bid Out Of Range / FCFS")
+    print("=" * 60)
+    
+    v = Vehicle(1, 'N', arrival_time=0, urgency=3, mechanism=Mechanism.AUCTION)
+    v.urgency = 12
+    assert v.bid == 120, f"Expected 120, got {v.bid}"
+    v.urgency = -1
+    assert v.bid == -10, f"Expected -10, got {v.bid}"
+    v.vehicle_type = VehicleType.URGENT
+    assert v.bid == 999, f"Expected 999, got {v.bid}"
+    print(f"Out-of-range urgencies: bid={v.bid} (formula, no table lookup)")
+    
+    # FCFS never bids, whatever urgency/type are set to
+    f = Vehicle(2, 'S', arrival_time=0, mechanism=Mechanism.FCFS)
+    f.urgency = 5
+    assert f.bid == 0, f"Expected FCFS bid 0, got {f.bid}"
+    f.vehicle_type = VehicleType.URGENT
+    assert f.bid == 0, f"Expected FCFS bid 0, got {f.bid}"
+    
+    # Switching mechanism also invalidates the bid
+    f.mechanism = Mechanism.AUCTION
+    assert f.bid == 1005, f"Expected 1005, got {f.bid}"
+    
+    print("✅ Bid falls back to the formula and FCFS always bids 0")
+    print()
+
+
 def test_fcfs_arrival_not_urgency():
     """Test that FCFS ignores urgency"""
     print("=" * 60)
@@ -121,78 +334,118 @@ def test_fcfs_arrival_not_urgency():
     print()
 
 
-def test_simulation_fairness():
+def test_simulation_fairness(seeded_runs):
     """Run simulation and check basic fairness"""
     print("=" * 60)
     print("TEST: Simulation Fairness")
     print("=" * 60)
     
-    # Run FCFS simulation
-    fcfs_model = SimpleIntersection(mechanism=Mechanism.FCFS, spawn_rate=0.3, seed=42)
-    for _ in range(100):
-        fcfs_model.step()
-    fcfs_stats = fcfs_model.get_stats()
-    
-    # Run AUCTION simulation with same seed
-    auction_model = SimpleIntersection(mechanism=Mechanism.AUCTION, spawn_rate=0.3, seed=42)
-    for _ in range(100):
-        auction_model.step()
-    auction_stats = auction_model.get_stats()
+    fcfs_stats = seeded_runs[Mechanism.FCFS]
+    auction_stats = seeded_runs[Mechanism.AUCTION]
     
-    print(f"FCFS (100 steps):")
+    print(f"FCFS ({SWEEP_STEPS} steps):")
     print(f"  - Spawned: {fcfs_stats['total_spawned']}")
     print(f"  - Crossed: {fcfs_stats['total_crossed']}")
     print(f"  - Avg Wait: {fcfs_stats['avg_wait_time']:.2f}")
     
-    print(f"\nAUCTION (100 steps):")
+    print(f"\nAUCTION ({SWEEP_STEPS} steps):")
     print(f"  - Spawned: {auction_stats['total_spawned']}")
     print(f"  - Crossed: {auction_stats['total_crossed']}")
     print(f"  - Avg Wait: {auction_stats['avg_wait_time']:.2f}")
     print(f"  - Auctions: {auction_stats.get('auctions_held', 0)}")
     print(f"  - Revenue: {auction_stats.get('total_revenue', 0)}")
     
+    # Same seed => same arrivals, whatever the mechanism
+    assert fcfs_stats['total_spawned'] == auction_stats['total_spawned']
+    assert auction_stats.get('auctions_held', 0) > 0
+    
     print("\n✅ Simulation runs correctly for both mechanisms")
     print()
 
 
-def test_negotiation_types():
-    """Test different negotiation types"""
+@pytest.mark.parametrize("mechanism", list(Mechanism), ids=lambda m: m.name)
+def test_occupancy_counters(mechanism):
+    """Test that running occupancy counters match a full recount"""
     print("=" * 60)
-    print("TEST: Negotiation Types")
+    print(f"TEST: Occupancy Counters ({mechanism.name})")
     print("=" * 60)
     
-    for neg_type in NegotiationType:
-        model = SimpleIntersection(
-            mechanism=Mechanism.NEGOTIATION, 
-            negotiation_type=neg_type,
-            spawn_rate=0.4,
-            seed=42
-        )
-        
-        for _ in range(50):
-            model.step()
-        
+    model = SimpleIntersection(mechanism=mechanism, spawn_rate=0.4, seed=SEED)
+    for _ in range(150):
+        model.step()
         stats = model.get_stats()
-        print(f"{neg_type.value}:")
-        print(f"  - Crossed: {stats['total_crossed']}")
-        print(f"  - Negotiations: {stats.get('negotiations_held', 0)}")
+        assert stats['parking_count'] == sum(len(p) for p in model.parking_zones.values())
+        assert stats['barrier_count'] == sum(len(q) for q in model.barrier_queues.values())
+        assert stats['waiting_at_intersection'] == sum(
+            1 for v in model.corridor_vehicles
+            if v.pos in WAITING_POSITIONS.values()
+        )
     
-    print("\n✅ All negotiation types work correctly")
+    print(f"✅ {mechanism.name}: running counters match recount over 150 steps")
     print()
 
 
-if __name__ == '__main__':
-    print("\n" + "=" * 60)
-    print("INTERSECTION MECHANISM TESTS")
-    print("=" * 60 + "\n")
+def test_parameter_sweep(seeded_runs):
+    """Test that sweep() matches sequential runs with the same seed"""
+    print("=" * 60)
+    print("TEST: Parameter Sweep")
+    print("=" * 60)
+    
+    configs = [
+        {'mechanism': mechanism, 'spawn_rate': 0.3, 'seed': SEED, 'n_steps': SWEEP_STEPS}
+        for mechanism in seeded_runs
+    ]
+    results = SimpleIntersection.sweep(configs, max_workers=2)
+    
+    for cfg, stats in zip(configs, results):
+        sequential = seeded_runs[cfg['mechanism']]
+        print(f"{cfg['mechanism'].name}: crossed={stats['total_crossed']}")
+        assert stats['total_crossed'] == sequential['total_crossed']
+        assert stats['avg_wait_time'] == sequential['avg_wait_time']
     
-    test_fcfs_priority()
-    test_auction_highest_bid_wins()
-    test_auction_urgent_priority()
-    test_fcfs_arrival_not_urgency()
-    test_simulation_fairness()
-    test_negotiation_types()
+    # In-process run (no pool) leaves the global logger as it was
+    assert logger.enabled
+    SimpleIntersection._run_one(dict(configs[0], n_steps=5))
+    assert logger.enabled, "_run_one must restore the logger state"
     
-    print("\n" + "=" * 60)
-    print("ALL TESTS PASSED! ✅")
-    print("=" * 60)
\ No newline at end of file
+    print("✅ Parallel sweep matches sequential runs")
+    print()
+
+
+@pytest.fixture(scope="module")
+def default_negotiation_stats():
+    """Seeded 50-step NEGOTIATION run with the default negotiation_type"""
+    return SimpleIntersection(
+        mechanism=Mechanism.NEGOTIATION, spawn_rate=0.4, seed=SEED
+    ).run(50)
+
+
+@pytest.mark.parametrize("neg_type", [
+    NegotiationType.STOCHASTIC,
+    NegotiationType.MARGINAL_UTILITY,
+    NegotiationType.TOKEN_BASED,
+])
+def test_negotiation_types(neg_type, default_negotiation_stats):
+    """Test that deprecated negotiation types all run Marginal Utility"""
+    print("=" * 60)
+    print(f"TEST: Negotiation Types ({neg_type})")
+    print("=" * 60)
+    
+    model = SimpleIntersection(
+        mechanism=Mechanism.NEGOTIATION, 
+        negotiation_type=neg_type,
+        spawn_rate=0.4,
+        seed=SEED
+    )
+    stats = model.run(50)
+    
+    print(f"  - Crossed: {stats['total_crossed']}")
+    print(f"  - Negotiations: {stats.get('negotiations_held', 0)}")
+    
+    # negotiation_type is deprecated: same protocol, same seeded outcome
+    assert stats['negotiations_held'] > 0
+    assert model.mechanism.get_last_negotiation()['method'] == 'Marginal Utility'
+    assert stats == default_negotiation_stats
+    
+    print(f"✅ {neg_type} falls back to Marginal Utility")
+    print()
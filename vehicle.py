@@ -13,13 +13,89 @@ BDI Components:
 import random
 from typing import Dict, List, Any, Optional
 from constants import (
-    VehicleState, VehicleType, Mechanism,
+    VehicleState, VehicleType, Mechanism, GRID_SIZE,
     ENTRY_POINTS, EXIT_POINTS, MOVE_DIRECTION, DIRECTION_AXIS,
-    PARKING_ZONES, BARRIER_POSITIONS,
+    PARKING_ZONES, BARRIER_POSITIONS, WAITING_POSITIONS,
     MIN_URGENCY, MAX_URGENCY, URGENT_THRESHOLD
 )
 
 
+# Bid lookup table indexed by [is_urgent][urgency], for 0 <= urgency <= MAX:
+#   Normal: urgency × 10, Urgent: 1000 + urgency
+_BID_LUT = (
+    tuple(u * 10 for u in range(MAX_URGENCY + 1)),
+    tuple(1000 + u for u in range(MAX_URGENCY + 1)),
+)
+
+
+def _step_position(pos: tuple, direction: str):
+    """Position one step ahead in `direction`, or None when leaving the grid"""
+    dx, dy = MOVE_DIRECTION[direction]
+    new_x = pos[0] + dx
+    new_y = pos[1] + dy
+    
+    # Check bounds (15x15 grid)
+    if not (0 <= new_x < GRID_SIZE and 0 <= new_y < GRID_SIZE):
+        return None  # Exit the grid
+    
+    return (new_x, new_y)
+
+
+# Successor of every grid cell, per direction: {direction: {pos: next_pos}}
+_NEXT_POSITION = {
+    direction: {
+        (x, y): _step_position((x, y), direction)
+        for x in range(GRID_SIZE) for y in range(GRID_SIZE)
+    }
+    for direction in MOVE_DIRECTION
+}
+_OFF_TABLE = object()  # get() sentinel: position outside the table
+
+
+# States in which Vehicle.move() advances the vehicle
+_MOVABLE_STATES = (VehicleState.IN_CORRIDOR, VehicleState.IN_CONFLICT)
+
+
+def _chicken_decision(strategy: str, own_urgency: int, other_urgency: int) -> str:
+    """
+    Chicken Game decision by expected utility ('yield' or 'go').
+    
+    See Vehicle.chicken_game_decision for the payoff matrix.
+    """
+    # Calculate expected utility for each action
+    # Assume other vehicle's probability of 'go' based on their urgency
+    p_other_go = other_urgency / 10.0
+    
+    # Expected utility of 'yield': 1 * (1 - p_other_go) + 0 * p_other_go
+    eu_yield = 1 * (1 - p_other_go) + 0 * p_other_go
+    
+    # Expected utility of 'go': 3 * (1 - p_other_go) + (-10) * p_other_go
+    eu_go = 3 * (1 - p_other_go) + (-10) * p_other_go
+    
+    # Adjust based on own urgency
+    eu_go += own_urgency * 0.5  # Higher urgency = more willing to risk
+    
+    # Strategy modifier
+    if strategy == 'aggressive':
+        eu_go += 2
+    elif strategy == 'cooperative':
+        eu_yield += 2
+    
+    # Decision
+    if eu_go > eu_yield:
+        return 'go'
+    return 'yield'
+
+
+# Decision table for every (strategy, own_urgency, other_urgency) in range
+_CHICKEN_DECISIONS = {
+    (strategy, own, other): _chicken_decision(strategy, own, other)
+    for strategy in ('aggressive', 'cooperative', 'defensive')
+    for own in range(MAX_URGENCY + 1)
+    for other in range(MAX_URGENCY + 1)
+}
+
+
 class BDIComponent:
     """
     BDI (Beliefs-Desires-Intentions) component for cognitive behavior.
@@ -27,6 +103,8 @@ class BDIComponent:
     This implements the cognitive architecture required for autonomous agents.
     """
     
+    __slots__ = ('vehicle_id', 'beliefs', 'desires', 'intentions')
+    
     def __init__(self, vehicle_id: int):
         self.vehicle_id = vehicle_id
         
@@ -61,9 +139,10 @@ class BDIComponent:
     
     def update_beliefs(self, perception: Dict[str, Any]):
         """Update beliefs based on new perceptions"""
+        beliefs = self.beliefs
         for key, value in perception.items():
-            if key in self.beliefs:
-                self.beliefs[key] = value
+            if key in beliefs:
+                beliefs[key] = value
     
     def add_other_vehicle(self, vehicle_id: int, position: tuple, 
                           direction: str, urgency: int):
@@ -81,8 +160,9 @@ class BDIComponent:
             return 0.0
         
         # Higher threat if on perpendicular path near intersection
-        own_pos = self.beliefs['own_position']
-        distance = abs(own_pos[0] - other_pos[0]) + abs(own_pos[1] - other_pos[1])
+        own_x, own_y = self.beliefs['own_position']
+        other_x, other_y = other_pos
+        distance = abs(own_x - other_x) + abs(own_y - other_y)
         
         if distance < 3:
             return 0.9  # Very close = high threat
@@ -172,6 +252,7 @@ class Vehicle:
         entry_pos: Entry point to corridor
         exit_pos: Exit point from corridor
         barrier_pos: Barrier gate position
+        waiting_pos: Position just before the intersection
     
     Timing:
         arrival_time: Step when spawned
@@ -180,6 +261,22 @@ class Vehicle:
         exit_time: Step when exited grid
     """
     
+    __slots__ = (
+        'id', 'direction', 'axis', '_mechanism',
+        # Positions
+        'pos', 'parking_pos', 'entry_pos', 'exit_pos', 'barrier_pos', 'waiting_pos',
+        # State and timing
+        'state', 'arrival_time', 'barrier_time', 'entry_time', 'exit_time',
+        # Urgency and bid
+        '_urgency', '_vehicle_type', '_bid_dirty',
+        'bid_amount', 'price_paid',
+        # Negotiation
+        'fuel_level', 'distance_remaining', 'negotiation_wins',
+        'negotiation_losses', 'is_negotiating',
+        # BDI
+        'bdi',
+    )
+    
     def __init__(self, vehicle_id: int, direction: str, arrival_time: int, 
                  urgency: int = None, is_urgent: bool = False,
                  mechanism: Mechanism = Mechanism.FCFS):
@@ -194,6 +291,7 @@ class Vehicle:
         self.entry_pos = ENTRY_POINTS[direction]
         self.exit_pos = EXIT_POINTS[direction]
         self.barrier_pos = BARRIER_POSITIONS[direction]
+        self.waiting_pos = WAITING_POSITIONS[direction]
         
         # State and timing
         self.state = VehicleState.IN_PARKING
@@ -234,27 +332,37 @@ class Vehicle:
     
     def _init_urgency(self, urgency: int, is_urgent: bool):
         """Initialize urgency based on mechanism type"""
-        if self.mechanism in [Mechanism.AUCTION, Mechanism.NEGOTIATION]:
-            if is_urgent:
-                # Forced urgent (e.g., emergency vehicle)
-                self.urgency = MAX_URGENCY
-                self.vehicle_type = VehicleType.URGENT
-            elif urgency is not None:
-                # Use provided urgency
-                self.urgency = max(MIN_URGENCY, min(urgency, MAX_URGENCY))
-                self.vehicle_type = (VehicleType.URGENT 
-                                     if self.urgency >= URGENT_THRESHOLD 
-                                     else VehicleType.NORMAL)
-            else:
-                # Random urgency
-                self.urgency = random.randint(MIN_URGENCY, MAX_URGENCY)
-                self.vehicle_type = (VehicleType.URGENT 
-                                     if self.urgency >= URGENT_THRESHOLD 
-                                     else VehicleType.NORMAL)
+        # Dispatch once on the mechanism: only AUCTION/NEGOTIATION use urgency
+        init = self._URGENCY_INITS.get(self.mechanism, Vehicle._init_no_urgency)
+        init(self, urgency, is_urgent)
+    
+    def _init_bid_urgency(self, urgency: int, is_urgent: bool):
+        """Urgency for AUCTION/NEGOTIATION (forced, provided or random)"""
+        if is_urgent:
+            # Forced urgent (e.g., emergency vehicle)
+            self.urgency = MAX_URGENCY
+            self.vehicle_type = VehicleType.URGENT
+            return
+        
+        if urgency is not None:
+            # Use provided urgency
+            self.urgency = max(MIN_URGENCY, min(urgency, MAX_URGENCY))
         else:
-            # FCFS: no urgency
-            self.urgency = 0
-            self.vehicle_type = VehicleType.NORMAL
+            # Random urgency
+            self.urgency = random.randint(MIN_URGENCY, MAX_URGENCY)
+        self.vehicle_type = (VehicleType.URGENT 
+                             if self.urgency >= URGENT_THRESHOLD 
+                             else VehicleType.NORMAL)
+    
+    def _init_no_urgency(self, urgency: int, is_urgent: bool):
+        """FCFS (and other mechanisms): no urgency"""
+        self.urgency = 0
+        self.vehicle_type = VehicleType.NORMAL
+    
+    _URGENCY_INITS = {
+        Mechanism.AUCTION: _init_bid_urgency,
+        Mechanism.NEGOTIATION: _init_bid_urgency,
+    }
     
     def is_urgent(self) -> bool:
         """Check if vehicle is urgent type"""
@@ -275,10 +383,51 @@ class Vehicle:
             self.bid_amount = 0
             return 0
         
-        if self.is_urgent():
-            self.bid_amount = 1000 + self.urgency
+        urgency = self.urgency
+        urgent = self.is_urgent()
+        if type(urgency) is int and 0 <= urgency <= MAX_URGENCY:
+            self.bid_amount = _BID_LUT[urgent][urgency]
+        elif urgent:
+            self.bid_amount = 1000 + urgency
         else:
-            self.bid_amount = self.urgency * 10
+            self.bid_amount = urgency * 10
+        return self.bid_amount
+    
+    # The bid depends on mechanism, urgency and vehicle_type: their setters
+    # mark the memoized bid dirty, so it can never go stale
+    @property
+    def mechanism(self) -> Mechanism:
+        return self._mechanism
+    
+    @mechanism.setter
+    def mechanism(self, value: Mechanism):
+        self._mechanism = value
+        self._bid_dirty = True
+    
+    @property
+    def urgency(self) -> int:
+        return self._urgency
+    
+    @urgency.setter
+    def urgency(self, value: int):
+        self._urgency = value
+        self._bid_dirty = True
+    
+    @property
+    def vehicle_type(self) -> VehicleType:
+        return self._vehicle_type
+    
+    @vehicle_type.setter
+    def vehicle_type(self, value: VehicleType):
+        self._vehicle_type = value
+        self._bid_dirty = True
+    
+    @property
+    def bid(self) -> int:
+        """Memoized bid, recomputed only after urgency/vehicle_type change"""
+        if self._bid_dirty:
+            self.calculate_bid()
+            self._bid_dirty = False
         return self.bid_amount
     
     def set_parking_position(self, pos: tuple):
@@ -304,19 +453,15 @@ class Vehicle:
         if self.pos is None:
             return self.entry_pos
         
-        dx, dy = MOVE_DIRECTION[self.direction]
-        new_x = self.pos[0] + dx
-        new_y = self.pos[1] + dy
-        
-        # Check bounds (15x15 grid)
-        if not (0 <= new_x < 15 and 0 <= new_y < 15):
-            return None  # Exit the grid
-        
-        return (new_x, new_y)
+        # On-grid positions: precomputed successor (None = exit the grid)
+        next_pos = _NEXT_POSITION[self.direction].get(self.pos, _OFF_TABLE)
+        if next_pos is _OFF_TABLE:
+            return _step_position(self.pos, self.direction)
+        return next_pos
     
     def move(self):
         """Move vehicle one step forward"""
-        if self.state not in [VehicleState.IN_CORRIDOR, VehicleState.IN_CONFLICT]:
+        if self.state not in _MOVABLE_STATES:
             return False
         
         next_pos = self.get_next_position()
@@ -454,9 +599,10 @@ class Vehicle:
         if self.pos is None or other_vehicle_pos is None:
             return False
         
-        # Calculate distance
-        distance = abs(self.pos[0] - other_vehicle_pos[0]) + \
-                   abs(self.pos[1] - other_vehicle_pos[1])
+        # Calculate distance (Manhattan)
+        own_x, own_y = self.pos
+        other_x, other_y = other_vehicle_pos
+        distance = abs(own_x - other_x) + abs(own_y - other_y)
         
         if distance < 2:  # Imminent collision
             self.emergency_stop()
@@ -491,37 +637,18 @@ class Vehicle:
         
         Returns: 'yield' or 'go'
         """
-        own_urgency = self.urgency
         strategy = self.bdi.intentions['strategy']
         
-        # Calculate expected utility for each action
-        # Assume other vehicle's probability of 'go' based on their urgency
-        p_other_go = other_urgency / 10.0
-        
-        # Expected utility of 'yield': 1 * (1 - p_other_go) + 0 * p_other_go
-        eu_yield = 1 * (1 - p_other_go) + 0 * p_other_go
-        
-        # Expected utility of 'go': 3 * (1 - p_other_go) + (-10) * p_other_go
-        eu_go = 3 * (1 - p_other_go) + (-10) * p_other_go
-        
-        # Adjust based on own urgency
-        eu_go += own_urgency * 0.5  # Higher urgency = more willing to risk
-        
-        # Strategy modifier
-        if strategy == 'aggressive':
-            eu_go += 2
-        elif strategy == 'cooperative':
-            eu_yield += 2
-        
-        # Decision
-        if eu_go > eu_yield:
-            return 'go'
-        return 'yield'
+        # Urgencies are small ints: decision precomputed in _CHICKEN_DECISIONS
+        decision = _CHICKEN_DECISIONS.get((strategy, self.urgency, other_urgency))
+        if decision is None:
+            decision = _chicken_decision(strategy, self.urgency, other_urgency)
+        return decision
 
     def __repr__(self):
         if self.mechanism == Mechanism.NEGOTIATION:
-            return f"V{self.id}({self.direction}, bid={self.calculate_bid()}, fuel={self.fuel_level})"
+            return f"V{self.id}({self.direction}, bid={self.bid}, fuel={self.fuel_level})"
         elif self.mechanism == Mechanism.AUCTION:
-            return f"V{self.id}({self.direction}, bid={self.calculate_bid()})"
+            return f"V{self.id}({self.direction}, bid={self.bid})"
         else:
             return f"V{self.id}({self.direction})"
\ No newline at end of file